@@ -0,0 +1,29 @@
+import argparse
+import sys
+
+from benchmarks.cases import cases
+from benchmarks.runner import compare, load, measure, report, save
+
+parser = argparse.ArgumentParser('python -m benchmarks', description='Times pydenim hot paths.')
+parser.add_argument('-k', '--filter', default='', help='only run cases whose names contain this')
+parser.add_argument('--max-scale', type=int, default=1_000_000,
+                    help='skip cases bigger than this many cells (or genomes); the biggest are 16,000,000')
+parser.add_argument('--repeat', type=int, default=5, help='how many times to time each case')
+parser.add_argument('--save', metavar='PATH', help='write the results to PATH as a JSON baseline')
+parser.add_argument('--compare', metavar='PATH', help='compare against the baseline at PATH')
+parser.add_argument('--threshold', type=float, default=1.25,
+                    help='with --compare, fail if anything got this many times slower')
+arguments = parser.parse_args()
+
+selected = [case for case in cases() if arguments.filter in case.name and case.scale <= arguments.max_scale]
+results = {}
+for case in selected:
+    results[case.name] = result = measure(case, arguments.repeat)
+    print(report(case.name, result), flush=True)
+
+if arguments.save:
+    save(arguments.save, results)
+
+if arguments.compare:
+    regressions = compare(load(arguments.compare), results, arguments.threshold)
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, List, NamedTuple, Tuple
+
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.genetics.gene import Gene, Genome, Modifier
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.misc.internal_types import Statistic
+from pydenim.seeding import founder_genes
+from pydenim.services import rng
+
+# (n_rows, n_cols, starting organisms), from game.py's board on up.
+BOARD_SIZES = [
+    (20, 15, 10),
+    (100, 100, 100),
+    (500, 500, 10_000),
+    (1000, 1000, 100_000),
+    (4000, 4000, 1_000_000),
+]
+GRID_SIZES = [(n_rows, n_cols) for n_rows, n_cols, _ in BOARD_SIZES]
+POPULATIONS = [10, 1000, 100_000, 1_000_000]
+
+
+class Case(NamedTuple):
+    # setup builds whatever run needs and isn't timed. run is timed, and must leave the state as it found it, since
+    # it's run more than once on the same state. units is how many cells (or genomes...) one run gets through.
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    units: int
+    unit: str
+    # Roughly how big the case is, for leaving out the big ones.
+    scale: int
+
+
+def cases() -> Iterator[Case]:
+    yield from board_cases()
+    yield from grid_cases()
+    yield from genetics_cases()
+
+
+def board_cases() -> Iterator[Case]:
+    for n_rows, n_cols, population in BOARD_SIZES:
+        def setup(n_rows=n_rows, n_cols=n_cols, population=population) -> Board:
+            return Board.initialise(Config(n_rows, n_cols, population, seed=0))
+
+        yield Case(f'board.age[{n_rows}x{n_cols},{population}]', setup, Board.age, n_rows * n_cols, 'cell',
+                   n_rows * n_cols)
+
+
+def grid_cases() -> Iterator[Case]:
+    for n_rows, n_cols in GRID_SIZES:
+        size = f'{n_rows}x{n_cols}'
+        area = n_rows * n_cols
+
+        def setup(n_rows=n_rows, n_cols=n_cols) -> Tuple[Sliceable2DList[int], List[int], List[int]]:
+            grid = Sliceable2DList([[y * n_cols + x for x in range(n_cols)] for y in range(n_rows)])
+            xs = [x for _ in range(n_rows) for x in range(n_cols)]
+            ys = [y for y in range(n_rows) for _ in range(n_cols)]
+            return grid, xs, ys
+
+        yield Case(f'grid.getitem[{size}]', setup, _get_each, area, 'cell', area)
+        yield Case(f'grid.setitem[{size}]', setup, _set_each, area, 'cell', area)
+        yield Case(f'grid.take[{size}]', setup, _take, area, 'cell', area)
+        yield Case(f'grid.put[{size}]', setup, _put, area, 'cell', area)
+        yield Case(f'grid.map[{size}]', setup, _map, area, 'cell', area)
+        yield Case(f'grid.iter_coords[{size}]', setup, _iter_coords, area, 'cell', area)
+
+
+def genetics_cases() -> Iterator[Case]:
+    for population in POPULATIONS:
+        def setup(population=population) -> List[Genome]:
+            with rng.substream('benchmarks'):
+                genes = rng.choices(founder_genes(), k=population * 5)
+
+            return [Genome(genes[start:start + 5]) for start in range(0, len(genes), 5)]
+
+        yield Case(f'genome.xor[{population}]', setup, _xor, population, 'genome', population)
+        yield Case(f'genome.breed[{population}]', setup, _breed, population, 'genome', population)
+        yield Case(f'genome.statistics[{population}]', setup, _statistics, population, 'genome', population)
+
+    genome = Genome([Gene([Modifier(Statistic.Strength, 1)])] * 50)
+    yield Case('genome.statistics[50 genes]', lambda: [genome] * 10_000, _statistics, 10_000, 'genome', 10_000)
+
+
+def _get_each(state):
+    grid, xs, ys = state
+    for x, y in zip(xs, ys):
+        grid[x, y]
+
+
+def _set_each(state):
+    grid, xs, ys = state
+    for x, y in zip(xs, ys):
+        grid[x, y] = grid[x, y]
+
+
+def _take(state):
+    grid, xs, ys = state
+    grid.take(xs, ys)
+
+
+def _put(state):
+    grid, xs, ys = state
+    grid.put(xs, ys, grid.take(xs, ys))
+
+
+def _map(state):
+    grid, _, _ = state
+    grid.map(lambda element: element)
+
+
+def _iter_coords(state):
+    grid, _, _ = state
+    for _ in grid.iter_coords():
+        pass
+
+
+def _xor(genomes: List[Genome]):
+    for left, right in zip(genomes, genomes[1:] + genomes[:1]):
+        left ^ right
+
+
+def _breed(genomes: List[Genome]):
+    Genome.breed(list(zip(genomes, genomes[1:] + genomes[:1])))
+
+
+def _statistics(genomes: List[Genome]):
+    # Statistics are cached per genome, so forget them first or only the first run would measure anything.
+    for genome in genomes:
+        genome.__dict__.pop('_statistics', None)
+        genome.generate_statistics()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple
+
+from benchmarks.cases import Case
+
+
+class Result(NamedTuple):
+    # Times are for a single run, in seconds.
+    best: float
+    median: float
+    units: int
+    unit: str
+    # Memory allocated by a run on top of what setup left behind, at its highest.
+    peak_bytes: int
+
+    @property
+    def ns_per_unit(self) -> float:
+        return self.best / self.units * 1e9
+
+    @property
+    def throughput(self) -> float:
+        return self.units / self.best
+
+
+def measure(case: Case, repeat: int = 5) -> Result:
+    state = case.setup()
+    case.run(state)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+
+    # tracemalloc slows everything down, so memory gets a run of its own.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        case.run(state)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+
+    finally:
+        tracemalloc.stop()
+
+    return Result(min(times), statistics.median(times), case.units, case.unit, peak)
+
+
+def report(name: str, result: Result) -> str:
+    return (f'{name:<40} {result.best * 1e3:>10.2f} ms {result.ns_per_unit:>10.1f} ns/{result.unit:<7} '
+            f'{result.throughput:>14,.0f} {result.unit}s/s {result.peak_bytes / 2 ** 20:>9.1f} MiB')
+
+
+def save(path: str, results: Dict[str, Result]):
+    document = {
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'time': datetime.now(timezone.utc).isoformat(),
+        'results': {name: {**result._asdict(), 'ns_per_unit': result.ns_per_unit, 'throughput': result.throughput}
+                    for name, result in results.items()}
+    }
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2)
+
+
+def load(path: str) -> Dict[str, Result]:
+    with open(path) as file:
+        document = json.load(file)
+
+    return {name: Result(*(result[field] for field in Result._fields)) for name, result in document['results'].items()}
+
+
+def compare(baseline: Dict[str, Result], results: Dict[str, Result], threshold: float) -> List[str]:
+    # Compares best times, which are the least noisy. Returns the names of the cases that got slower than threshold.
+    regressions = []
+    for name, result in results.items():
+        if (before := baseline.get(name)) is None:
+            continue
+
+        ratio = result.best / before.best
+        regressed = ratio > threshold
+        print(f'{name:<40} {before.best * 1e3:>10.2f} ms -> {result.best * 1e3:>10.2f} ms  x{ratio:.2f}'
+              f'{"  REGRESSED" if regressed else ""}')
+        if regressed:
+            regressions.append(name)
+
+    return regressions
@@ -1,9 +1,19 @@
 from pydenim.board import Board
 from pydenim.config import Config
-from pydenim.renderer.console import ConsoleRenderer
+from pydenim.renderer.background import BackgroundRenderer
+from pydenim.renderer.console import IncrementalConsoleRenderer
+
+EPOCHS = 200
 
 config = Config(n_rows=20, n_cols=15, starting_organism_count=10)
 board = Board.initialise(config)
-renderer = ConsoleRenderer()
 
-renderer.render_board(board)
+# The simulation never waits on the terminal: frames it can't keep up with are dropped. Boards from age() never
+# change, so there's no need to snapshot them.
+with BackgroundRenderer(IncrementalConsoleRenderer(), snapshot=False) as renderer:
+    for _ in range(EPOCHS):
+        renderer.render_board(board)
+        board = board.age()
+
+    renderer.wait()
+    renderer.render_text(str(renderer.metrics()))
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pydenim.config import Config
+from pydenim.misc.constants import FOOD_CHANCE, FOOD_LIFESPAN, FOOD_VALUE, OBSTACLE_ID, SPACE_ID, WALL_ID
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.objects.base import BoardActor
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Egg, Food
+from pydenim.objects.organism import Organism, conceptions
+from pydenim.profiling import NO_PROFILER, Profiler
+from pydenim.services import id_generator, lineage, rng
+from pydenim.topology import Topology
+
+if TYPE_CHECKING:
+    from pydenim.board import Board, PositionedBoardActor
+    from pydenim.seeding import Seeding
+
+# Walls, obstacles and spaces are singletons, so their IDs double as their kind codes.
+FOOD_KIND = 3
+EGG_KIND = 4
+ORGANISM_KIND = 5
+
+_SINGLETONS = {WALL_ID: WALL, OBSTACLE_ID: OBSTACLE, SPACE_ID: SPACE}
+
+# (ys, xs), as returned by np.nonzero.
+Positions = Tuple[np.ndarray, np.ndarray]
+
+
+def age_cells(kinds: np.ndarray, lifespans: np.ndarray, values: np.ndarray, ids: np.ndarray,
+              rng: np.random.Generator) -> Tuple[Positions, Positions]:
+    # Decays food, counts eggs down and spawns food, in place. Hatching eggs and new food need objects and IDs that
+    # don't live in the arrays, so they're left for the caller to fill in.
+    timed = (kinds == FOOD_KIND) | (kinds == EGG_KIND)
+    expired = timed & (lifespans == 0)
+    hatching = expired & (kinds == EGG_KIND)
+    spoiled = expired & (kinds == FOOD_KIND)
+    spaces = np.flatnonzero(kinds == SPACE_ID)
+    spawning = np.sort(rng.choice(spaces, rng.binomial(len(spaces), FOOD_CHANCE), replace=False))
+
+    lifespans[timed & ~expired] -= 1
+    kinds[spoiled] = SPACE_ID
+    ids[spoiled] = SPACE_ID
+
+    kinds.flat[spawning] = FOOD_KIND
+    lifespans.flat[spawning] = FOOD_LIFESPAN
+    values.flat[spawning] = FOOD_VALUE
+    return np.nonzero(hatching), np.unravel_index(spawning, kinds.shape)
+
+
+class ArrayBoard:
+    # Same contract as Board, but the grid lives in parallel arrays instead of one object per cell. Only eggs and
+    # organisms, which carry genomes, are kept as objects (keyed by ID); everything else is rebuilt on demand.
+    #
+    # There's no active index or timer wheel to keep up to date: active and timers are worked out from the arrays
+    # whenever they're asked for, in the same shape as Board's, and can't be written to. Food spawns in the same pass
+    # that counts everything down, so the profiler puts all of it down to 'expire'.
+
+    def __init__(self, config: Config, kinds: np.ndarray, lifespans: np.ndarray, values: np.ndarray, ids: np.ndarray,
+                 objects: Dict[int, BoardActor], epoch: int = 0, profiler: Profiler = NO_PROFILER):
+        self.config = config
+        self.kinds = kinds
+        self.lifespans = lifespans
+        self.values = values
+        self.ids = ids
+        self.objects = objects
+        self.epoch = epoch
+        self.topology = Topology.of(config)
+        self.profiler = profiler
+
+    def __iter__(self) -> Iterator[List[BoardActor]]:
+        n_rows, n_cols = self.kinds.shape
+        return ([self._decode(x, y) for x in range(n_cols)] for y in range(n_rows))
+
+    def __getitem__(self, coordinates: Tuple[Union[int, slice], Union[int, slice]]):
+        x, y = coordinates
+        if isinstance(x, int) and isinstance(y, int):
+            return self._decode(x, y)
+
+        # Only decode the cells asked for, not the whole board.
+        n_rows, n_cols = self.kinds.shape
+        rows = [[self._decode(x, y) for x in self._axis(x, n_cols)] for y in self._axis(y, n_rows)]
+        if isinstance(x, int):
+            return [row[0] for row in rows]
+
+        elif isinstance(y, int):
+            return rows[0]
+
+        return Sliceable2DList(rows)
+
+    @property
+    def actors(self) -> Sliceable2DList[BoardActor]:
+        return Sliceable2DList(self)
+
+    @property
+    def active(self) -> List[PositionedBoardActor]:
+        # Highest priority first, like iterating over Board's index.
+        return self._positioned(np.nonzero(self.kinds == ORGANISM_KIND))
+
+    @property
+    def timers(self) -> List[Tuple[int, PositionedBoardActor]]:
+        ys, xs = np.nonzero((self.kinds == FOOD_KIND) | (self.kinds == EGG_KIND))
+        return [(self.epoch + int(self.lifespans[y, x]) + 1, (int(x), int(y), self._decode(x, y)))
+                for y, x in zip(ys, xs)]
+
+    def age(self) -> ArrayBoard:
+        board = self.snapshot()
+        board.step_in_place()
+        return board
+
+    def step_in_place(self) -> ArrayBoard:
+        # Same as age, but writes straight into these arrays.
+        epoch = self.epoch + 1
+        profiler = self.profiler
+        profiler.start(epoch)
+        lineage.advance(epoch)
+        self.epoch = epoch
+        living = np.nonzero(self.kinds == ORGANISM_KIND)
+        with profiler.phase('expire'):
+            hatching, spawned = age_cells(self.kinds, self.lifespans, self.values, self.ids, rng.numpy())
+
+        with profiler.phase('age'):
+            self._settle(living, hatching, spawned)
+
+        self._interact()
+        with profiler.phase('write'):
+            self._collect()
+
+        profiler.finish()
+        return self
+
+    def snapshot(self) -> ArrayBoard:
+        arrays = (array.copy() for array in (self.kinds, self.lifespans, self.values, self.ids))
+        return ArrayBoard(self.config, *arrays, dict(self.objects), self.epoch, self.profiler)
+
+    @classmethod
+    def from_board(cls, board: Board) -> ArrayBoard:
+        n_rows, n_cols = board.actors.dims
+        kinds = np.full((n_rows, n_cols), SPACE_ID, dtype=np.uint8)
+        lifespans = np.zeros((n_rows, n_cols), dtype=np.int32)
+        values = np.zeros((n_rows, n_cols), dtype=np.int32)
+        ids = np.full((n_rows, n_cols), SPACE_ID, dtype=np.int64)
+        array_board = cls(board.config, kinds, lifespans, values, ids, {}, board.epoch, board.profiler)
+        for x, y, actor in board.actors.iter_coords():
+            array_board._put(x, y, actor)
+
+        # Boards don't count lifespans down in the actors themselves, only in their timers.
+        for due, (x, y, actor) in board.timers:
+            if board.actors[x, y] is actor:
+                lifespans[y, x] = due - board.epoch - 1
+
+        return array_board
+
+    @classmethod
+    def seeded(cls, config: Config, seeding: Seeding) -> ArrayBoard:
+        shape = (config.n_rows, config.n_cols)
+        kinds = np.full(shape, SPACE_ID if config.wrap else WALL_ID, dtype=np.uint8)
+        kinds[1:-1, 1:-1] = SPACE_ID
+        kinds.flat[seeding.obstacles] = OBSTACLE_ID
+        kinds.flat[seeding.positions] = ORGANISM_KIND
+        ids = kinds.astype(np.int64)
+        ids.flat[seeding.positions] = [organism.id for organism in seeding.organisms]
+        objects = {organism.id: organism for organism in seeding.organisms}
+        return cls(config, kinds, np.zeros(shape, dtype=np.int32), np.zeros(shape, dtype=np.int32), ids, objects)
+
+    def to_board(self) -> Board:
+        from pydenim.board import Board
+
+        return Board(self.config, self.actors, self.epoch, profiler=self.profiler)
+
+    def _settle(self, living: Positions, hatching: Positions, spawned: Positions):
+        spawned_ids = id_generator.allocate(len(spawned[0]))
+        self.ids[spawned] = np.arange(spawned_ids.start, spawned_ids.stop)
+        hatched = [(x, y, self._decode(x, y).birth()) for y, x in zip(*hatching)]
+        self.profiler.expired(hatched)
+        for x, y, organism in hatched:
+            self._put(x, y, organism)
+
+        for y, x in zip(*living):
+            self._put(x, y, self.objects[self.ids[y, x]].age())
+
+    def _interact(self, positions: Optional[Positions] = None):
+        profiler = self.profiler
+        with profiler.phase('schedule'):
+            active = self._positioned(np.nonzero(self.kinds == ORGANISM_KIND) if positions is None else positions)
+            active_xs = [x for x, _, _ in active]
+            active_ys = [y for _, y, _ in active]
+            neighbours = zip(*self.topology.neighbours(active_xs, active_ys, self.topology.draw(len(active))))
+
+        with profiler.phase('interact'):
+            eggs, before, after = [], [], []
+            for (x, y, actor), (neighbour_x, neighbour_y) in zip(active, neighbours):
+                # Whatever was here may have been eaten, killed or moved by a faster organism.
+                if self.kinds[y, x] != ORGANISM_KIND or self.ids[y, x] != actor.id:
+                    continue
+
+                neighbour = self._decode(neighbour_x, neighbour_y)
+                new_actor, new_neighbour = self.objects[actor.id].interact(neighbour)
+                self._put(x, y, new_actor)
+                self._put(neighbour_x, neighbour_y, new_neighbour)
+                eggs += conceptions(new_actor, new_neighbour)
+                if profiler.enabled:
+                    before += actor, neighbour
+                    after += new_actor, new_neighbour
+
+            # Nothing reads a child's genome until it hatches, so everything conceived this epoch can be bred together.
+            Egg.fertilise(eggs)
+
+        profiler.interactions(before, after)
+
+    def _collect(self):
+        live_ids = self.ids[(self.kinds == EGG_KIND) | (self.kinds == ORGANISM_KIND)].tolist()
+        self.objects = {id: self.objects[id] for id in live_ids}
+
+    def _positioned(self, positions: Positions) -> List[PositionedBoardActor]:
+        ys, xs = positions
+        return sorted(((int(x), int(y), self.objects[self.ids[y, x]]) for y, x in zip(ys, xs)),
+                      key=lambda p_actor: p_actor[2].priority, reverse=True)
+
+    @staticmethod
+    def _axis(index: Union[int, slice], size: int) -> Sequence[int]:
+        positions = range(size)[index]
+        return positions if isinstance(index, slice) else [positions]
+
+    def _decode(self, x: int, y: int) -> BoardActor:
+        kind = self.kinds[y, x]
+        id = int(self.ids[y, x])
+        if kind == FOOD_KIND:
+            return Food(id, int(self.lifespans[y, x]), int(self.values[y, x]))
+
+        elif kind == EGG_KIND:
+            return self.objects[id].with_lifespan(int(self.lifespans[y, x]))
+
+        elif kind == ORGANISM_KIND:
+            return self.objects[id]
+
+        else:
+            return _SINGLETONS[kind]
+
+    def _put(self, x: int, y: int, actor: BoardActor):
+        if isinstance(actor, Food):
+            kind, lifespan, value = FOOD_KIND, actor.lifespan, actor.value
+
+        elif isinstance(actor, Egg):
+            kind, lifespan, value = EGG_KIND, actor.lifespan, 0
+            self.objects[actor.id] = actor
+
+        elif isinstance(actor, Organism):
+            kind, lifespan, value = ORGANISM_KIND, 0, 0
+            self.objects[actor.id] = actor
+
+        elif actor.id in _SINGLETONS:
+            kind, lifespan, value = actor.id, 0, 0
+
+        else:
+            raise TypeError(actor)
+
+        self.kinds[y, x] = kind
+        self.lifespans[y, x] = lifespan
+        self.values[y, x] = value
+        self.ids[y, x] = actor.id
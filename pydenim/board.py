@@ -1,26 +1,45 @@
 from __future__ import annotations
 
 from operator import attrgetter
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
 
 from pydenim.config import Config
-from pydenim.misc.data_structures import Sliceable2DList
-from pydenim.misc.functional import choice
+from pydenim.misc.constants import CHUNK_SIZE, FOOD_CHANCE, FOOD_LIFESPAN, FOOD_VALUE
+from pydenim.misc.data_structures import ChunkedGrid, PriorityIndex, Sliceable2DList, TimerWheel
+from pydenim.misc.functional import bernoulli_indices
+from pydenim.misc.internal_types import Engine
 from pydenim.objects.base import BoardActor, DynamicActor
-from pydenim.objects.neutral import SPACE, WALL
-from pydenim.objects.organism import Organism
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Egg, Food
+from pydenim.objects.organism import conceptions
+from pydenim.profiling import NO_PROFILER, Profiler
+from pydenim.scheduling import Interaction, schedule
+from pydenim.seeding import Seeding, seed_world
+from pydenim.services import id_generator, lineage, rng
+from pydenim.topology import Topology
+
+if TYPE_CHECKING:
+    from pydenim.array_board import ArrayBoard
 
 # This should be handled with a parametrised type, but it didn't really work out.
 PositionedDynamicActor = Tuple[int, int, DynamicActor]
 PositionedBoardActor = Tuple[int, int, BoardActor]
 
+# Actors that sit still until their lifespan runs out, then expire into something else.
+TIMED = (Food, Egg)
+
 
 class Board:
 
-    def __init__(self, config: Config, actors: Sliceable2DList[BoardActor], epoch: int = 0):
+    def __init__(self, config: Config, actors: Sliceable2DList[BoardActor], epoch: int = 0,
+                 active: Optional[PriorityIndex[DynamicActor]] = None,
+                 timers: Optional[TimerWheel[PositionedBoardActor]] = None, profiler: Profiler = NO_PROFILER):
         self.config = config
         self.actors = actors
         self.epoch = epoch
+        self.active = self._index_active(actors) if active is None else active
+        self.timers = self._index_timers(actors, epoch) if timers is None else timers
+        self.topology = Topology.of(config)
+        self.profiler = profiler
 
     def __iter__(self):
         return iter(self.actors)
@@ -29,50 +48,183 @@ class Board:
         return self.actors[coordinates]
 
     def age(self) -> Board:
-        new_actors = self.actors.map(lambda actor: actor.age())
-        removed_actors = set()
-        for p_actor, p_neighbour in self._get_interacting_pairs(new_actors):
-            actor_x, actor_y, actor = p_actor
-            neighbour_x, neighbour_y, neighbour = p_neighbour
-            old_ids = {actor.id, neighbour.id}
-            if old_ids & removed_actors:
-                break
+        # Only cells that something happens to are written, so the new grid starts off as a snapshot of this one.
+        board = self.snapshot()
+        board.step_in_place()
+        return board
+
+    def step_in_place(self) -> Board:
+        # Same as age, but writes straight into this board. Anything still holding on to it will see it change, but
+        # snapshots taken before won't.
+        epoch = self.epoch + 1
+        profiler = self.profiler
+        profiler.start(epoch)
+        lineage.advance(epoch)
+        with profiler.phase('spawn'):
+            self._spawn_food(epoch)
+
+        with profiler.phase('expire'):
+            self._expire(epoch)
+
+        with profiler.phase('age'):
+            xs, ys, actors = self._columns(list(self.active), 3)
+            self._place(epoch, xs, ys, [actor.age() for actor in actors])
+
+        self._settle(epoch)
+        self.epoch = epoch
+        profiler.finish()
+        return self
 
-            new_actor, new_neighbour = actor.interact(neighbour)
-            new_ids = {new_actor.id, new_neighbour.id}
-            for id in old_ids - new_ids:
-                removed_actors.add(id)
+    def snapshot(self) -> Board:
+        # Cheap: the grids share their rows (and the timer wheels their buckets) until one of them writes to it.
+        return Board(self.config, self.actors.snapshot(), self.epoch, self.active.copy(), self.timers.copy(),
+                     self.profiler)
+
+    @classmethod
+    def initialise(cls, config: Config) -> Union[Board, ArrayBoard]:
+        # Another world may have left the lineage clock anywhere, and founders are born at epoch 0.
+        lineage.advance(0)
+        if config.seed is None:
+            # The substream would come out the same every time, so unseeded worlds just carry on from the shared one.
+            seeding = seed_world(config)
+
+        else:
+            rng.reseed(config.seed)
+            with rng.substream('initialise'):
+                seeding = seed_world(config)
+
+        if config.engine is Engine.Array:
+            # NumPy is only needed by the array engine, so don't import it unless asked to.
+            from pydenim.array_board import ArrayBoard
+
+            return ArrayBoard.seeded(config, seeding)
+
+        # Only the organisms can be active and nothing is on a timer yet, so there's no need to look at every cell.
+        active = PriorityIndex(attrgetter('priority'))
+        for index, organism in zip(seeding.positions, seeding.organisms):
+            y, x = divmod(index, config.n_cols)
+            active.put(x, y, organism)
+
+        return cls(config, cls._scatter(config, seeding), 0, active, TimerWheel())
+
+    def _expire(self, epoch: int):
+        xs, ys, actors = self._columns(self.timers.pop(epoch), 3)
+        # Whatever was here may have been eaten or trampled in the meantime.
+        expiring = [(x, y, actor.expire()) for x, y, actor, current in zip(xs, ys, actors, self.actors.take(xs, ys))
+                    if current is actor]
+        self.profiler.expired(expiring)
+        self._place(epoch, *self._columns(expiring, 3))
+
+    def _settle(self, epoch: int):
+        profiler = self.profiler
+        with profiler.phase('schedule'):
+            xs, ys, actors = self._columns(list(self.active), 3)
+            neighbour_xs, neighbour_ys = self.topology.neighbours(xs, ys, self.topology.draw(len(actors)))
+            batches = schedule(map(Interaction, xs, ys, actors, neighbour_xs, neighbour_ys))
+
+        for batch in batches:
+            with profiler.phase('interact'):
+                # Nothing in a batch shares a cell, so all of it can be read at once, worked out, and written back at
+                # once.
+                actor_xs, actor_ys, _, neighbour_xs, neighbour_ys = self._columns(batch, 5)
+                actors = self.actors.take(actor_xs, actor_ys)
+                neighbours = self.actors.take(neighbour_xs, neighbour_ys)
+                xs, ys, outcomes = [], [], []
+                for interaction, actor, neighbour in zip(batch, actors, neighbours):
+                    # Whatever was here may have been eaten, killed or moved by a faster organism.
+                    if actor.id != interaction.actor.id:
+                        continue
+
+                    (actor_x, actor_y), (neighbour_x, neighbour_y) = interaction.cells
+                    xs += actor_x, neighbour_x
+                    ys += actor_y, neighbour_y
+                    outcomes += actor.interact(neighbour)
+
+                # Children's genomes aren't read until they hatch, so the whole batch can be bred in one go.
+                Egg.fertilise(conceptions(*outcomes))
+
+            if profiler.enabled:
+                # The cells are all different, so they still hold exactly what went in.
+                profiler.interactions(self.actors.take(xs, ys), outcomes)
+
+            with profiler.phase('write'):
+                self._place(epoch, xs, ys, outcomes)
+
+    def _place(self, epoch: int, xs: List[int], ys: List[int], actors: List[BoardActor]):
+        # Writes everything that actually changed in one go, then keeps the active index and timers up to date.
+        changed = [(x, y, actor) for x, y, actor, current in zip(xs, ys, actors, self.actors.take(xs, ys))
+                   if actor is not current]
+        self.actors.put(*self._columns(changed, 3))
+        for x, y, actor in changed:
+            self._track(self.active, x, y, actor)
+            if isinstance(actor, TIMED):
+                self.timers.schedule(epoch + actor.lifespan + 1, (x, y, actor))
 
-            new_actors[actor_x, actor_y] = new_actor
-            new_actors[neighbour_x, neighbour_y] = new_neighbour
+    @staticmethod
+    def _scatter(config: Config, seeding: Seeding) -> Sliceable2DList[BoardActor]:
+        n_rows, n_cols = config.n_rows, config.n_cols
+        # Wrapped worlds have no edge, so no walls either.
+        edge = SPACE if config.wrap else WALL
+        if config.engine is Engine.Chunked:
+            actors = ChunkedGrid(n_rows, n_cols, SPACE, edge, CHUNK_SIZE)
+            for index in seeding.obstacles:
+                y, x = divmod(index, n_cols)
+                actors[x, y] = OBSTACLE
+
+            for index, organism in zip(seeding.positions, seeding.organisms):
+                y, x = divmod(index, n_cols)
+                actors[x, y] = organism
+
+            return actors
+
+        # Build the rows whole rather than filling them in cell by cell.
+        rows = [[edge] * n_cols] + [[edge] + [SPACE] * (n_cols - 2) + [edge] for _ in range(n_rows - 2)] + \
+               [[edge] * n_cols]
+        for index in seeding.obstacles:
+            y, x = divmod(index, n_cols)
+            rows[y][x] = OBSTACLE
+
+        for index, organism in zip(seeding.positions, seeding.organisms):
+            y, x = divmod(index, n_cols)
+            rows[y][x] = organism
+
+        return Sliceable2DList(rows)
+
+    def _spawn_food(self, epoch: int):
+        # One roll per cell would be FOOD_CHANCE * area rolls wasted on failures, so sample the successes directly
+        # instead. Anything that isn't a space (before anything expires this epoch) is simply passed over.
+        n_rows, n_cols = self.actors.dims
+        ys, xs = self._columns([divmod(index, n_cols) for index in bernoulli_indices(n_rows * n_cols, FOOD_CHANCE)], 2)
+        spawned = [(x, y) for x, y, actor in zip(xs, ys, self.actors.take(xs, ys)) if actor is SPACE]
+        xs, ys = self._columns(spawned, 2)
+        self._place(epoch, xs, ys, [Food(id, FOOD_LIFESPAN, FOOD_VALUE) for id in id_generator.allocate(len(spawned))])
 
-        return Board(self.config, new_actors, self.epoch + 1)
+    @staticmethod
+    def _columns(rows: Sequence[tuple], n: int) -> Tuple[list, ...]:
+        return tuple(map(list, zip(*rows))) if rows else tuple([] for _ in range(n))
 
     @classmethod
-    def initialise(cls, config: Config) -> Board:
-        actors = Sliceable2DList.uniform(config.n_rows, config.n_cols, WALL)
-        actors.inner.fill(SPACE)
-
-        starting_organisms = cls._generate_starting_organisms()
-        for organism in starting_organisms:
-            actors.inner.inner = organism
+    def _index_active(cls, actors: Sliceable2DList[BoardActor]) -> PriorityIndex[DynamicActor]:
+        active = PriorityIndex(attrgetter('priority'))
+        for x, y, actor in actors.iter_occupied():
+            if actor.interacts:
+                active.put(x, y, actor)
 
-        return cls(config, actors, 0)
+        return active
 
-    def _get_interacting_pairs(self, actors: Sliceable2DList[BoardActor]):
-        active_actors = ((x, y, actor) for x, y, actor in actors.iter_coords() if actor.interacts)
-        actors_by_priority = (obj for *_, obj in sorted(active_actors, key=attrgetter('priority'), reverse=True))
-        neighbours = (self._get_neighbour(x, y) for x, y, _ in active_actors)
-        return zip(actors_by_priority, neighbours)
+    @classmethod
+    def _index_timers(cls, actors: Sliceable2DList[BoardActor], epoch: int) -> TimerWheel[PositionedBoardActor]:
+        timers = TimerWheel()
+        for x, y, actor in actors.iter_occupied():
+            if isinstance(actor, TIMED):
+                timers.schedule(epoch + actor.lifespan + 1, (x, y, actor))
 
-    @staticmethod
-    def _generate_starting_organisms() -> List[Organism]:
-        pass
+        return timers
 
     @staticmethod
-    def _add_obstacles_and_organisms(actors: Sliceable2DList, row_size: int):
-        pass
+    def _track(active: PriorityIndex[DynamicActor], x: int, y: int, actor: BoardActor):
+        if actor.interacts:
+            active.put(x, y, actor)
 
-    def _get_neighbour(self, x: int, y: int) -> PositionedBoardActor:
-        x, y = choice([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
-        return x, y, self[x, y]
+        else:
+            active.discard(x, y)
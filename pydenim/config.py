@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from typing import Optional
+
+from pydenim.misc.constants import GENES_PER_ORGANISM, OBSTACLE_CHANCE
+from pydenim.misc.internal_types import Engine, Neighbourhood
 
 
 @dataclass(frozen=True)
@@ -6,3 +10,17 @@ class Config:
     n_rows: int
     n_cols: int
     starting_organism_count: int
+    engine: Engine = Engine.Object
+    seed: Optional[int] = None
+    obstacle_chance: float = OBSTACLE_CHANCE
+    genes_per_organism: int = GENES_PER_ORGANISM
+    neighbourhood: Neighbourhood = Neighbourhood.VonNeumann
+    # Wrapped worlds are toroidal, with no walls around the edge.
+    wrap: bool = False
+
+    def __post_init__(self):
+        # Walled worlds spend a row and a column on each side on walls, so they need at least one cell inside those.
+        minimum = 1 if self.wrap else 3
+        if self.n_rows < minimum or self.n_cols < minimum:
+            raise ValueError(f'Could not make a {self.n_rows}x{self.n_cols} world: it needs to be at least '
+                             f'{minimum}x{minimum}.')
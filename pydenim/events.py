@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import struct
+import threading
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+
+from pydenim.misc.internal_types import EventKind, Overflow
+
+# For events that only involve one actor.
+NO_ID = -1
+
+MAGIC = b'PDEV\x01'
+
+
+class Event(NamedTuple):
+    epoch: int
+    kind: EventKind
+    actor_id: int
+    other_id: int
+    x: int
+    y: int
+
+
+class EventLog:
+    # Events are packed straight into a fixed ring buffer as they're emitted, and a writer thread copies them out to
+    # the file in batches, so the simulation never waits on I/O unless it's told to (with Overflow.Block) and the
+    # writer has fallen a whole buffer behind.
+    #
+    # Until it's opened, the log throws everything away.
+
+    _RECORD = struct.Struct('<qBqqii')
+
+    def __init__(self, capacity: int = 1 << 16, overflow: Overflow = Overflow.Block, batch_size: int = 4096,
+                 interval: float = 0.1):
+        self.capacity = capacity
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.interval = interval
+        self.emitted = 0
+        self.dropped = 0
+        self._file: Optional[BinaryIO] = None
+        self._owns_file = False
+        self._writer: Optional[threading.Thread] = None
+        self._buffer = bytearray(capacity * self._RECORD.size)
+        self._pack = self._RECORD.pack_into
+        self._size = self._RECORD.size
+        # These count records ever, not positions in the buffer: emitted, copied out of it (or dropped), and written to
+        # the file (or dropped).
+        self._head = 0
+        self._tail = 0
+        self._written = 0
+        self._closing = False
+        self._flushing = False
+        # Whatever stopped the writer, to be raised on the simulation's side.
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._readable = threading.Condition(self._lock)
+        self._writable = threading.Condition(self._lock)
+        self.emit = self._discard
+
+    def __enter__(self) -> EventLog:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def open(self, file: Union[str, BinaryIO]) -> EventLog:
+        if self._writer is not None:
+            raise RuntimeError('Event log is already open.')
+
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, 'wb') if self._owns_file else file
+        self._file.write(MAGIC)
+        self._closing = False
+        self._error = None
+        self._writer = threading.Thread(target=self._write, name='event-log', daemon=True)
+        self._writer.start()
+        self.emit = self._emit
+        return self
+
+    def close(self):
+        if self._writer is None:
+            return
+
+        self.emit = self._discard
+        with self._lock:
+            self._closing = True
+            self._readable.notify()
+
+        self._writer.join()
+        self._writer = None
+        if self._owns_file:
+            self._file.close()
+
+        else:
+            self._file.flush()
+
+        self._file = None
+        self._raise()
+
+    def flush(self):
+        # Waits until everything emitted so far is in the file.
+        with self._lock:
+            self._flushing = True
+            self._readable.notify()
+            self._writable.wait_for(lambda: self._written == self._head or self._writer is None
+                                    or self._error is not None)
+            self._raise()
+
+    def _emit(self, epoch: int, kind: EventKind, actor_id: int, other_id: int = NO_ID, x: int = -1, y: int = -1):
+        with self._lock:
+            self._raise()
+            if self._head - self._tail == self.capacity:
+                if self.overflow is Overflow.DropNewest:
+                    self.dropped += 1
+                    return
+
+                elif self.overflow is Overflow.DropOldest:
+                    self.dropped += 1
+                    self._tail += 1
+
+                else:
+                    self._readable.notify()
+                    self._writable.wait_for(lambda: self._head - self._tail < self.capacity or self._error is not None)
+                    self._raise()
+
+            self._pack(self._buffer, self._head % self.capacity * self._size, epoch, kind.value, actor_id, other_id, x, y)
+            self._head += 1
+            self.emitted += 1
+            if self._head - self._tail == self.batch_size:
+                self._readable.notify()
+
+    def _discard(self, epoch: int, kind: EventKind, actor_id: int, other_id: int = NO_ID, x: int = -1, y: int = -1):
+        pass
+
+    def _raise(self):
+        if self._error is not None:
+            raise self._error
+
+    def _write(self):
+        try:
+            self._write_batches()
+
+        except Exception as error:
+            # Nothing will ever drain the buffer again, so wake up anyone waiting for it to, and let them raise.
+            with self._lock:
+                self._error = error
+                self._writable.notify_all()
+
+    def _write_batches(self):
+        size = self._size
+        while True:
+            with self._lock:
+                self._readable.wait_for(lambda: self._closing or self._flushing
+                                        or self._head - self._tail >= self.batch_size, self.interval)
+                self._flushing = False
+                start, stop = self._tail % self.capacity, self._head % self.capacity
+                count = self._head - self._tail
+                # Copy out whatever's there (in up to two pieces, if it wraps around), so the buffer can be reused
+                # while the copy is being written.
+                if count and start < stop:
+                    chunk = bytes(self._buffer[start * size:stop * size])
+
+                elif count:
+                    chunk = bytes(self._buffer[start * size:]) + bytes(self._buffer[:stop * size])
+
+                else:
+                    chunk = b''
+
+                self._tail = copied = self._head
+                closing = self._closing
+                self._writable.notify_all()
+
+            if chunk:
+                self._file.write(chunk)
+                self._file.flush()
+
+            with self._lock:
+                self._written = copied
+                self._writable.notify_all()
+
+            if closing:
+                return
+
+
+def read_events(file: Union[str, BinaryIO]) -> Iterator[Event]:
+    if isinstance(file, str):
+        with open(file, 'rb') as opened:
+            yield from read_events(opened)
+
+        return
+
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError('Not an event log.')
+
+    for epoch, kind, actor_id, other_id, x, y in EventLog._RECORD.iter_unpack(file.read()):
+        yield Event(epoch, EventKind(kind), actor_id, other_id, x, y)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass
-from itertools import chain, groupby
-from typing import List, NamedTuple
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, NamedTuple, Sequence, Tuple
 
 from pydenim.misc.constants import MUTATION_CHANCE
-from pydenim.misc.functional import either, attrgettern
+from pydenim.misc.functional import bernoulli_indices
 from pydenim.misc.internal_types import Statistic
 from pydenim.objects.organism import Statistics
+from pydenim.services import gene_pool, rng
+
+STATISTICS = list(Statistic)
+_STATISTIC_INDICES = {statistic: index for index, statistic in enumerate(STATISTICS)}
+_NO_STATISTICS = (0,) * len(STATISTICS)
 
 
 class Modifier(NamedTuple):
@@ -18,26 +22,82 @@ class Modifier(NamedTuple):
 
 @dataclass(frozen=True)
 class Gene:
-    modifiers: List[Modifier]
+    modifiers: Tuple[Modifier, ...]
+    # The modifiers summed up by statistic, in STATISTICS order, so that genomes never need to look at the modifiers.
+    vector: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'modifiers', tuple(self.modifiers))
+        vector = [0] * len(STATISTICS)
+        for statistic, amount in self.modifiers:
+            vector[_STATISTIC_INDICES[statistic]] += amount
+
+        object.__setattr__(self, 'vector', tuple(vector))
+
+    def __reduce__(self):
+        # Anything unpickled (say, coming back from a worker process) goes back into this process' pool.
+        return _pooled_gene, (self.modifiers,)
 
     def mutate(self) -> Gene:
-        if random.random() >= MUTATION_CHANCE:
+        if rng.random() >= MUTATION_CHANCE:
             return self
 
+        return self.mutated()
+
+    def mutated(self) -> Gene:
         return self
 
 
 @dataclass(frozen=True)
 class Genome:
-    genes: List[Gene]
+    # Genes come out of the gene pool, so equal genes across the whole population are the same object.
+    genes: Tuple[Gene, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, 'genes', tuple(map(gene_pool.intern, self.genes)))
+
+    @classmethod
+    def from_pooled(cls, genes: Sequence[Gene]) -> Genome:
+        # For genes that already came out of the pool, which is most of them once a population gets going.
+        genome = object.__new__(cls)
+        object.__setattr__(genome, 'genes', tuple(genes))
+        return genome
+
+    def __reduce__(self):
+        # The genes are pooled on the way in, so the genome doesn't need to pool them again.
+        return Genome.from_pooled, (self.genes,)
 
     def __xor__(self, other: Genome) -> Genome:
-        genes = [either(left_gene, right_gene).mutate() for left_gene, right_gene in zip(self.genes, other.genes)]
-        return Genome(genes)
+        return self.breed([(self, other)])[0]
+
+    @classmethod
+    def breed(cls, parents: Sequence[Tuple[Genome, Genome]]) -> List[Genome]:
+        # Crosses every pair over in one go: one draw decides which parent every gene comes from, and another decides
+        # which genes mutate, instead of a draw or two per gene.
+        n_genes = sum(min(len(left.genes), len(right.genes)) for left, right in parents)
+        from_right = format(rng.getrandbits(n_genes), f'0{n_genes}b') if n_genes else ''
+        mutating = set(bernoulli_indices(n_genes, MUTATION_CHANCE))
+        children = []
+        index = 0
+        for left, right in parents:
+            genes = []
+            for left_gene, right_gene in zip(left.genes, right.genes):
+                gene = right_gene if from_right[index] == '1' else left_gene
+                genes.append(gene_pool.intern(gene.mutated()) if index in mutating else gene)
+                index += 1
+
+            children.append(cls.from_pooled(genes))
+
+        return children
 
     def generate_statistics(self) -> Statistics:
-        all_modifiers = chain.from_iterable(gene.modifiers for gene in self.genes)
-        by_statistic = attrgettern('statistic', 'name')
-        grouped = groupby(sorted(all_modifiers, key=by_statistic), by_statistic)
-        statistics = {stat.lower(): sum(modifier for _, modifier in group) for stat, group in grouped}
-        return Statistics(health=100, **statistics)
+        return self._statistics
+
+    @cached_property
+    def _statistics(self) -> Statistics:
+        # Statistics lists its fields in STATISTICS order, with health last.
+        return Statistics(*map(sum, zip(_NO_STATISTICS, *[gene.vector for gene in self.genes])), 100)
+
+
+def _pooled_gene(modifiers: Tuple[Modifier, ...]) -> Gene:
+    return gene_pool.intern(Gene(modifiers))
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pydenim.misc.internal_types import Gender
+
+# Founders have no parents.
+NO_PARENT = -1
+
+
+class Lineage(NamedTuple):
+    id: int
+    father_id: int
+    mother_id: int
+    gender: Gender
+    birth_epoch: int
+
+
+class SpilledBatch(NamedTuple):
+    # Where one eviction's worth of rows went in the spill file.
+    first_id: int
+    last_id: int
+    offset: int
+    count: int
+
+
+class LineageStore:
+    # An append-only table of who was born to whom, so that organisms only need to remember their parents' IDs and
+    # nobody keeps their whole family tree alive.
+    #
+    # Rows are kept in columns, in birth order. With a retention window, rows more than that many epochs old are moved
+    # out of memory: appended to the spill file if there is one, or dropped otherwise. Spilled rows can still be looked
+    # up, just slowly: each eviction is indexed by its range of IDs, so a lookup only reads the batches that might hold
+    # it.
+    #
+    # Every board shares this store, and one that's been rewound (by stepping an old snapshot) moves its epoch
+    # backwards. Births are recorded at whatever the epoch is, but eviction only ever goes by the latest epoch seen, and
+    # only takes rows off the front, so an out of order birth just keeps everything after it around a bit longer.
+
+    _RECORD = struct.Struct('<qqqbq')
+
+    def __init__(self, retention: Optional[int] = None, spill_path: Optional[str] = None):
+        self.retention = retention
+        self.spill_path = spill_path
+        self.epoch = 0
+        self._watermark = 0
+        self._ids = array('q')
+        self._father_ids = array('q')
+        self._mother_ids = array('q')
+        self._genders = array('b')
+        self._birth_epochs = array('q')
+        self._rows: Dict[int, int] = {}
+        self._evicted = 0
+        self._spilled: List[SpilledBatch] = []
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id: int):
+        return id in self._rows
+
+    def __getitem__(self, id: int) -> Lineage:
+        if (row := self._rows.get(id)) is not None:
+            row -= self._evicted
+            return Lineage(id, self._father_ids[row], self._mother_ids[row], Gender(self._genders[row]),
+                           self._birth_epochs[row])
+
+        if (lineage := self._find_spilled(id)) is not None:
+            return lineage
+
+        raise KeyError(id)
+
+    def record(self, id: int, father_id: Optional[int], mother_id: Optional[int], gender: Gender):
+        self._rows[id] = self._evicted + len(self._ids)
+        self._ids.append(id)
+        self._father_ids.append(NO_PARENT if father_id is None else father_id)
+        self._mother_ids.append(NO_PARENT if mother_id is None else mother_id)
+        self._genders.append(gender.value)
+        self._birth_epochs.append(self.epoch)
+
+    def record_founders(self, ids: Sequence[int], genders: Sequence[Gender]):
+        # Everyone at once, for seeding a world. Founders have no parents, by definition.
+        start = self._evicted + len(self._ids)
+        self._rows.update(zip(ids, range(start, start + len(ids))))
+        self._ids.extend(ids)
+        self._father_ids.extend([NO_PARENT] * len(ids))
+        self._mother_ids.extend([NO_PARENT] * len(ids))
+        self._genders.extend(gender.value for gender in genders)
+        self._birth_epochs.extend([self.epoch] * len(ids))
+
+    def advance(self, epoch: int):
+        self.epoch = epoch
+        self._watermark = max(self._watermark, epoch)
+        if self.retention is not None:
+            cutoff = self._watermark - self.retention
+            birth_epochs = self._birth_epochs
+            n = 0
+            while n < len(birth_epochs) and birth_epochs[n] < cutoff:
+                n += 1
+
+            self._evict(n)
+
+    def parents(self, id: int) -> Tuple[Optional[Lineage], Optional[Lineage]]:
+        lineage = self[id]
+        return self._get(lineage.father_id), self._get(lineage.mother_id)
+
+    def ancestors(self, id: int, generations: Optional[int] = None) -> Iterator[Lineage]:
+        # Breadth first, so nearer ancestors come first. Anyone who has been dropped is silently skipped.
+        generation = [id]
+        depth = 0
+        while generation and (generations is None or depth < generations):
+            parents = [parent for child in generation for parent in self.parents(child) if parent is not None]
+            yield from parents
+            generation = [parent.id for parent in parents]
+            depth += 1
+
+    def _get(self, id: int) -> Optional[Lineage]:
+        if id == NO_PARENT:
+            return None
+
+        try:
+            return self[id]
+
+        except KeyError:
+            return None
+
+    def _evict(self, n: int):
+        if n <= 0:
+            return
+
+        columns = (self._ids, self._father_ids, self._mother_ids, self._genders, self._birth_epochs)
+        if self.spill_path is not None:
+            with open(self.spill_path, 'ab') as spill:
+                offset = spill.tell()
+                spill.write(b''.join(self._RECORD.pack(*row) for row in zip(*(column[:n] for column in columns))))
+
+            ids = self._ids[:n]
+            self._spilled.append(SpilledBatch(min(ids), max(ids), offset, n))
+
+        for id in self._ids[:n]:
+            del self._rows[id]
+
+        for column in columns:
+            del column[:n]
+
+        self._evicted += n
+
+    def _find_spilled(self, id: int) -> Optional[Lineage]:
+        if self.spill_path is None:
+            return None
+
+        batches = [batch for batch in self._spilled if batch.first_id <= id <= batch.last_id]
+        if not batches:
+            return None
+
+        size = self._RECORD.size
+        with open(self.spill_path, 'rb') as spill:
+            for batch in batches:
+                spill.seek(batch.offset)
+                for spilled_id, father_id, mother_id, gender, birth_epoch in \
+                        self._RECORD.iter_unpack(spill.read(batch.count * size)):
+                    if spilled_id == id:
+                        return Lineage(spilled_id, father_id, mother_id, Gender(gender), birth_epoch)
+
+        return None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Hashable, NamedTuple
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from pydenim.genetics.gene import Gene
+
+
+class PoolStatistics(NamedTuple):
+    lookups: int
+    hits: int
+    live: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        # How many genes were asked for per gene actually kept around.
+        misses = self.lookups - self.hits
+        return self.lookups / misses if misses else 1.0
+
+
+class GenePool:
+    # Hands out one canonical Gene per set of modifiers, so a population that has been breeding for a while shares a
+    # handful of genes instead of holding millions of equal copies. The pool only holds genes weakly: once no genome
+    # refers to a gene any more, it drops out.
+
+    def __init__(self):
+        self._genes: WeakValueDictionary[Hashable, Gene] = WeakValueDictionary()
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self._genes)
+
+    def intern(self, gene: Gene) -> Gene:
+        self.lookups += 1
+        # Keyed by the modifiers rather than the gene, since the keys are held strongly.
+        canonical = self._genes.setdefault(gene.modifiers, gene)
+        if canonical is not gene:
+            self.hits += 1
+
+        return canonical
+
+    def statistics(self) -> PoolStatistics:
+        return PoolStatistics(self.lookups, self.hits, len(self))
+
+    def reset_statistics(self):
+        self.lookups = 0
+        self.hits = 0
@@ -4,8 +4,18 @@ SPACE_ID = 2
 
 MIN_MODIFIERS = 1
 MAX_MODIFIERS = 3
+MIN_MODIFIER_AMOUNT = -1
+MAX_MODIFIER_AMOUNT = 3
+
+OBSTACLE_CHANCE = 0.05
+GENES_PER_ORGANISM = 5
+FOUNDER_GENES = 64
+
+CHUNK_SIZE = 16
 
 FOOD_CHANCE = 0.2
+FOOD_LIFESPAN = 10
+FOOD_VALUE = 5
 
 IGNORE_CHANCE = 0.2
 MATE_CHANCE = 0.2
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import copy
-from typing import List, Tuple, Union, Callable, TypeVar, Generic, Iterable, NamedTuple, Optional
+import itertools
+import operator
+from array import array
+from functools import reduce
+from typing import Dict, Set, List, Tuple, Union, Callable, TypeVar, Generic, Iterable, Iterator, NamedTuple, Optional, \
+    Sequence
 
 T = TypeVar('T')
 U = TypeVar('U')
 
 SetterValue = Union[T, Iterable[T], Iterable[Iterable[T]]]
+Direction = Tuple[int, int]
 Dims = Tuple[int, int]
 Coordinate = Union[int, slice]
 Coordinates = Tuple[Coordinate, Coordinate]
@@ -22,13 +28,14 @@ class Bounds(NamedTuple):
     y_max: int
 
 
-# TODO: Make this a SliceableNDList :)
-
-
 class Sliceable2DList(Generic[T]):
 
+    # Rows may be shared between grids (see map and snapshot), so every write goes through _writable_row, which copies a
+    # row the first time this grid writes to it unless the grid already owns it.
+
     def __init__(self, data: Iterable[Iterable[T]]):
         self._data, (n_rows, n_cols) = self._validate_dims(data)
+        self._owned: Set[int] = set(range(n_rows))
         self._parent = None
         self._bounds = Bounds(0, n_cols, 0, n_rows)
         self.dims = (n_rows, n_cols)
@@ -54,7 +61,7 @@ class Sliceable2DList(Generic[T]):
     def __setitem__(self, coordinates: Coordinates, value: SetterValue):
         proper_x, proper_y = self._adjust(coordinates)
         if isinstance(proper_x, int) and isinstance(proper_y, int):
-            self._data[proper_y][proper_x] = value
+            self._writable_row(proper_y)[proper_x] = value
 
         elif isinstance(proper_x, int):
             y_extent = proper_y.stop - proper_y.start
@@ -63,7 +70,7 @@ class Sliceable2DList(Generic[T]):
                 raise ValueError(f'Could not fill a column of size {y_extent} with data of size {size}.')
 
             for y, element in enumerate(elements, proper_y.start):
-                self._data[y][proper_x] = element
+                self._writable_row(y)[proper_x] = element
 
         elif isinstance(proper_y, int):
             x_extent = proper_x.stop - proper_x.start
@@ -71,7 +78,7 @@ class Sliceable2DList(Generic[T]):
             if (size := len(elements)) != proper_x.stop - proper_x.start:
                 raise ValueError(f'Could not fill a column of size {x_extent} with data of size {size}.')
 
-            self._data[proper_y][proper_x] = elements
+            self._writable_row(proper_y)[proper_x] = elements
 
         else:
             x_extent = proper_x.stop - proper_x.start
@@ -82,7 +89,7 @@ class Sliceable2DList(Generic[T]):
                 raise ValueError(f'Could not fill a block of shape {(x_extent, y_extent)} with data of shape {dims}.')
 
             for y, row in enumerate(elements, proper_y.start):
-                self._data[y][proper_x] = row
+                self._writable_row(y)[proper_x] = row
 
     @property
     def values(self):
@@ -100,10 +107,9 @@ class Sliceable2DList(Generic[T]):
         self.inner[:, :] = value
 
     def apply(self, f: Callable[[T], U]):
-        data = self._data
         x_min, x_max, y_min, y_max = self._bounds
         for y in range(y_min, y_max):
-            row = data[y]
+            row = self._writable_row(y)
             for x in range(x_min, x_max):
                 row[x] = f(row[x])
 
@@ -115,6 +121,35 @@ class Sliceable2DList(Generic[T]):
             for x in range(x_min, x_max):
                 yield x, y, row[x]
 
+    def iter_occupied(self):
+        # Cells that aren't just background. In a dense grid, that's all of them.
+        return self.iter_coords()
+
+    # take, put and neighbours are for reading and writing lots of cells at once: the view's bounds are worked out once
+    # per call instead of once per cell. Coordinates are relative to the view, like with indexing, but can't be
+    # negative.
+
+    def take(self, xs: Sequence[int], ys: Sequence[int]) -> List[T]:
+        x_min, _, y_min, _ = self._bounds
+        data = self._data
+        return [data[y + y_min][x + x_min] for x, y in zip(xs, ys)]
+
+    def put(self, xs: Sequence[int], ys: Sequence[int], values: Sequence[T]):
+        self._check_batch(xs, ys, values)
+        x_min, _, y_min, _ = self._bounds
+        for x, y, value in zip(xs, ys, values):
+            self._writable_row(y + y_min)[x + x_min] = value
+
+    def neighbours(self, xs: Sequence[int], ys: Sequence[int], directions: Sequence[Direction]) -> List[T]:
+        self._check_batch(xs, ys, directions)
+        return self.take([x + dx for x, (dx, _) in zip(xs, directions)],
+                         [y + dy for y, (_, dy) in zip(ys, directions)])
+
+    def map_coords(self, f: Callable[[int, int, T], U]) -> Sliceable2DList[U]:
+        x_min, x_max, y_min, y_max = self._bounds
+        return self._share_unchanged([[f(x, y, row[x]) for x in range(x_min, x_max)] for y, row in
+                                      enumerate(self._data[y_min:y_max], y_min)])
+
     def fill(self, fill_value: T):
         self.apply(lambda element: fill_value)
 
@@ -123,7 +158,16 @@ class Sliceable2DList(Generic[T]):
 
     def map(self, f: Callable[[T], U]) -> Sliceable2DList[U]:
         x_min, x_max, y_min, y_max = self._bounds
-        return Sliceable2DList([[f(element) for element in row[x_min:x_max]] for row in self._data[y_min:y_max]])
+        return self._share_unchanged([[f(element) for element in row[x_min:x_max]] for row in self._data[y_min:y_max]])
+
+    def snapshot(self) -> Sliceable2DList[T]:
+        # O(rows): the snapshot shares every row with this grid until one of them writes to it.
+        x_min, x_max, y_min, y_max = self._bounds
+        if (x_min, x_max) != (0, self.dims[1]):
+            return self.map(lambda element: element)
+
+        self._owned.difference_update(range(y_min, y_max))
+        return self._from_rows(self._data[y_min:y_max], set())
 
     @classmethod
     def uniform(cls, n_rows: int, n_cols: int, fill_value: Optional[T] = None) -> Sliceable2DList[T]:
@@ -156,6 +200,41 @@ class Sliceable2DList(Generic[T]):
         x_min, x_max, y_min, y_max = self._bounds
         return adjust_individual(x, x_min, x_max), adjust_individual(y, y_min, y_max)
 
+    @staticmethod
+    def _check_batch(*columns: Sequence):
+        if len(set(map(len, columns))) > 1:
+            raise ValueError(f'Got coordinates and values of different lengths {tuple(map(len, columns))}.')
+
+    def _writable_row(self, y: int) -> List[T]:
+        if y not in self._owned:
+            self._data[y] = list(self._data[y])
+            self._owned.add(y)
+
+        return self._data[y]
+
+    def _share_unchanged(self, rows: List[List[U]]) -> Sliceable2DList[U]:
+        x_min, x_max, y_min, y_max = self._bounds
+        owned = set(range(len(rows)))
+        if (x_min, x_max) == (0, self.dims[1]):
+            for y, new_row in enumerate(rows):
+                old_row = self._data[y + y_min]
+                if all(map(operator.is_, new_row, old_row)):
+                    rows[y] = old_row
+                    owned.discard(y)
+                    self._owned.discard(y + y_min)
+
+        return self._from_rows(rows, owned)
+
+    @classmethod
+    def _from_rows(cls, rows: List[List[T]], owned: Set[int]) -> Sliceable2DList[T]:
+        grid = cls.__new__(cls)
+        grid._data = rows
+        grid._owned = owned
+        grid._parent = None
+        grid.dims = (len(rows), len(rows[0]) if rows else 0)
+        grid._bounds = Bounds(0, grid.dims[1], 0, grid.dims[0])
+        return grid
+
     def _from_parent(self, bounds: Bounds) -> Sliceable2DList[T]:
         child = copy.copy(self)
         child._parent = self
@@ -201,3 +280,514 @@ class Sliceable2DList(Generic[T]):
 
     def __repr__(self):
         return self.__str__()
+
+
+class ChunkedGrid(Sliceable2DList[T]):
+    # For grids that are mostly background. Cells live in square chunks that are only allocated once something other
+    # than background is written into them, and freed again once they're all background. The background is fill_value,
+    # except along the edges, where it's edge_value if there is one (walls, say).
+    #
+    # It does everything Sliceable2DList does, but anything that has to look at every cell (apply, map, values, and
+    # iter_coords) still costs as much as the whole area. iter_occupied only visits allocated chunks.
+
+    def __init__(self, n_rows: int, n_cols: int, fill_value: T, edge_value: Optional[T] = None, chunk_size: int = 64):
+        if chunk_size <= 0 or chunk_size & (chunk_size - 1):
+            raise ValueError(f'Chunk size must be a power of two, not {chunk_size}.')
+
+        self.fill_value = fill_value
+        self.edge_value = fill_value if edge_value is None else edge_value
+        self.chunk_size = chunk_size
+        self._shift = chunk_size.bit_length() - 1
+        self._mask = chunk_size - 1
+        self._chunks: Dict[Tuple[int, int], List[T]] = {}
+        self._counts: Dict[Tuple[int, int], int] = {}
+        self._owned: Set[Tuple[int, int]] = set()
+        self._parent = None
+        self._bounds = Bounds(0, n_cols, 0, n_rows)
+        self.dims = (n_rows, n_cols)
+
+    def __iter__(self):
+        n_rows, n_cols = self.dims
+        return ([self._get(x, y) for x in range(n_cols)] for y in range(n_rows))
+
+    def __getitem__(self, coordinates: Coordinates) -> Union[T, Sliceable2DList[T]]:
+        proper_x, proper_y = self._adjust(coordinates)
+        if isinstance(proper_y, slice):
+            if isinstance(proper_x, slice):
+                return self._from_parent(self._slices_to_bounds(proper_x, proper_y))
+
+            else:
+                return [self._get(proper_x, y) for y in range(proper_y.start, proper_y.stop)]
+
+        elif isinstance(proper_x, slice):
+            return [self._get(x, proper_y) for x in range(proper_x.start, proper_x.stop)]
+
+        else:
+            self._check(proper_x, proper_y)
+            return self._get(proper_x, proper_y)
+
+    def __setitem__(self, coordinates: Coordinates, value: SetterValue):
+        proper_x, proper_y = self._adjust(coordinates)
+        if isinstance(proper_x, int) and isinstance(proper_y, int):
+            self._check(proper_x, proper_y)
+            self._set(proper_x, proper_y, value)
+
+        elif isinstance(proper_x, int):
+            y_extent = proper_y.stop - proper_y.start
+            elements = list(value)
+            if (size := len(elements)) != y_extent:
+                raise ValueError(f'Could not fill a column of size {y_extent} with data of size {size}.')
+
+            for y, element in enumerate(elements, proper_y.start):
+                self._set(proper_x, y, element)
+
+        elif isinstance(proper_y, int):
+            x_extent = proper_x.stop - proper_x.start
+            elements = list(value)
+            if (size := len(elements)) != x_extent:
+                raise ValueError(f'Could not fill a column of size {x_extent} with data of size {size}.')
+
+            for x, element in enumerate(elements, proper_x.start):
+                self._set(x, proper_y, element)
+
+        else:
+            x_extent = proper_x.stop - proper_x.start
+            y_extent = proper_y.stop - proper_y.start
+            elements, dims = self._validate_dims(value)
+            n_rows, n_cols = dims
+            if (x_extent != n_cols) or (y_extent != n_rows):
+                raise ValueError(f'Could not fill a block of shape {(x_extent, y_extent)} with data of shape {dims}.')
+
+            for y, row in enumerate(elements, proper_y.start):
+                for x, element in enumerate(row, proper_x.start):
+                    self._set(x, y, element)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def values(self):
+        x_min, x_max, y_min, y_max = self._bounds
+        return [[self._get(x, y) for x in range(x_min, x_max)] for y in range(y_min, y_max)]
+
+    def apply(self, f: Callable[[T], U]):
+        x_min, x_max, y_min, y_max = self._bounds
+        for y in range(y_min, y_max):
+            for x in range(x_min, x_max):
+                self._set(x, y, f(self._get(x, y)))
+
+    def iter_coords(self):
+        x_min, x_max, y_min, y_max = self._bounds
+        for y in range(y_min, y_max):
+            for x in range(x_min, x_max):
+                yield x, y, self._get(x, y)
+
+    def iter_occupied(self):
+        x_min, x_max, y_min, y_max = self._bounds
+        shift, mask = self._shift, self._mask
+        for (chunk_x, chunk_y), chunk in list(self._chunks.items()):
+            for index, element in enumerate(chunk):
+                if element is _BACKGROUND:
+                    continue
+
+                x = chunk_x << shift | index & mask
+                y = chunk_y << shift | index >> shift
+                if x_min <= x < x_max and y_min <= y < y_max:
+                    yield x, y, element
+
+    def take(self, xs: Sequence[int], ys: Sequence[int]) -> List[T]:
+        x_min, _, y_min, _ = self._bounds
+        get = self._get
+        return [get(x + x_min, y + y_min) for x, y in zip(xs, ys)]
+
+    def put(self, xs: Sequence[int], ys: Sequence[int], values: Sequence[T]):
+        self._check_batch(xs, ys, values)
+        x_min, _, y_min, _ = self._bounds
+        set_ = self._set
+        for x, y, value in zip(xs, ys, values):
+            set_(x + x_min, y + y_min, value)
+
+    def map_coords(self, f: Callable[[int, int, T], U]) -> Sliceable2DList[U]:
+        # Dense, so best kept to small views.
+        x_min, x_max, y_min, y_max = self._bounds
+        return Sliceable2DList([[f(x, y, self._get(x, y)) for x in range(x_min, x_max)] for y in range(y_min, y_max)])
+
+    def map(self, f: Callable[[T], U]) -> Sliceable2DList[U]:
+        return Sliceable2DList([[f(element) for element in row] for row in self.values])
+
+    def snapshot(self) -> Sliceable2DList[T]:
+        # O(chunks): the snapshot shares every chunk with this grid until one of them writes to it.
+        if self._bounds != (0, self.dims[1], 0, self.dims[0]):
+            return self.map(lambda element: element)
+
+        grid = copy.copy(self)
+        grid._chunks = dict(self._chunks)
+        grid._counts = dict(self._counts)
+        grid._owned = set()
+        self._owned.clear()
+        return grid
+
+    def _get(self, x: int, y: int) -> T:
+        if (chunk := self._chunks.get((x >> self._shift, y >> self._shift))) is not None:
+            element = chunk[(y & self._mask) << self._shift | x & self._mask]
+            if element is not _BACKGROUND:
+                return element
+
+        return self._background(x, y)
+
+    def _set(self, x: int, y: int, value: T):
+        key = (x >> self._shift, y >> self._shift)
+        index = (y & self._mask) << self._shift | x & self._mask
+        background = value is self._background(x, y)
+        if (chunk := self._chunks.get(key)) is None:
+            if background:
+                return
+
+            chunk = self._chunks[key] = [_BACKGROUND] * (self.chunk_size * self.chunk_size)
+            self._counts[key] = 0
+            self._owned.add(key)
+
+        elif key not in self._owned:
+            chunk = self._chunks[key] = list(chunk)
+            self._owned.add(key)
+
+        count = self._counts[key] + (chunk[index] is _BACKGROUND) - background
+        chunk[index] = _BACKGROUND if background else value
+        if count:
+            self._counts[key] = count
+
+        else:
+            del self._chunks[key]
+            del self._counts[key]
+            self._owned.discard(key)
+
+    def _background(self, x: int, y: int) -> T:
+        n_rows, n_cols = self.dims
+        return self.edge_value if x == 0 or y == 0 or x == n_cols - 1 or y == n_rows - 1 else self.fill_value
+
+    def _check(self, x: int, y: int):
+        n_rows, n_cols = self.dims
+        if not (0 <= x < n_cols and 0 <= y < n_rows):
+            raise IndexError((x, y))
+
+
+# Marks cells in a chunk that are whatever the background is there.
+_BACKGROUND = object()
+
+
+class SliceableNDList(Generic[T]):
+    # Indexed like NumPy (outermost axis first), so [y, x] and not Sliceable2DList's [x, y]. Every index that isn't all
+    # integers gives back a view over the same backing store: steps, negative steps, transposes and views of views
+    # all just move the offset and strides around and never copy. Pass a typecode to keep numeric data in an
+    # array.array, which NumPy can then use in place through __array__ (or, on 3.12+, memoryview).
+    #
+    # An (epoch, row, col) history is then one SliceableNDList.uniform((n_epochs, n_rows, n_cols)), and history[epoch]
+    # is a view of a single world.
+
+    def __init__(self, data: Iterable, ndim: Optional[int] = None, typecode: Optional[str] = None):
+        elements, shape = self._flatten(data, ndim)
+        self._data: Union[List[T], array] = list(elements) if typecode is None else array(typecode, elements)
+        self._offset = 0
+        self.shape = shape
+        self.strides = self._contiguous_strides(shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self) -> Iterator[Union[T, SliceableNDList[T]]]:
+        return (self[index] for index in range(len(self)))
+
+    def __eq__(self, other):
+        return self.values == (other.values if isinstance(other, SliceableNDList) else other)
+
+    def __getitem__(self, index) -> Union[T, SliceableNDList[T]]:
+        offset, shape, strides = self._index(index)
+        return self._view(offset, shape, strides) if shape else self._data[offset]
+
+    def __setitem__(self, index, value):
+        offset, shape, strides = self._index(index)
+        if not shape:
+            self._data[offset] = value
+            return
+
+        elements, value_shape = self._flatten(value, len(shape))
+        if value_shape != shape:
+            raise ValueError(f'Could not fill a block of shape {shape} with data of shape {value_shape}.')
+
+        data = self._data
+        for position, element in zip(self._view(offset, shape, strides)._positions(), elements):
+            data[position] = element
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+
+        shared = isinstance(self._data, array)
+        if shared:
+            itemsize = self._data.itemsize
+            result = np.ndarray(self.shape, np.dtype(self._data.typecode), buffer=self._data,
+                                offset=self._offset * itemsize, strides=[stride * itemsize for stride in self.strides])
+
+        elif copy is False:
+            raise ValueError('Could not export Python objects to NumPy without copying them.')
+
+        else:
+            # Python objects can't be shared with NumPy, so this one is a copy.
+            result = np.empty(self.shape, dtype=object)
+            result.ravel()[:] = [self._data[position] for position in self._positions()]
+
+        if dtype is not None and np.dtype(dtype) != result.dtype:
+            if copy is False:
+                raise ValueError(f'Could not convert {result.dtype} to {np.dtype(dtype)} without copying.')
+
+            return result.astype(dtype)
+
+        return result.copy() if copy and shared else result
+
+    def __buffer__(self, flags: int) -> memoryview:
+        if not isinstance(self._data, array) or self.strides != self._contiguous_strides(self.shape):
+            raise BufferError('Only contiguous views of typed data can be exported.')
+
+        view = memoryview(self._data)[self._offset:self._offset + self.size]
+        return view.cast('B').cast(self._data.typecode, self.shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return reduce(operator.mul, self.shape, 1)
+
+    @property
+    def values(self) -> list:
+        if self.size == 0:
+            return self._empty(self.shape)
+
+        elements = [self._data[position] for position in self._positions()]
+        for size in reversed(self.shape[1:]):
+            elements = [elements[start:start + size] for start in range(0, len(elements), size)]
+
+        return elements
+
+    @property
+    def inner(self) -> SliceableNDList[T]:
+        return self[(slice(1, -1),) * self.ndim]
+
+    @property
+    def T(self) -> SliceableNDList[T]:
+        return self.transpose()
+
+    def transpose(self, *axes: int) -> SliceableNDList[T]:
+        axes = axes or tuple(reversed(range(self.ndim)))
+        if sorted(axes) != list(range(self.ndim)):
+            raise ValueError(f'{axes} is not a permutation of the axes of a {self.ndim}-dimensional list.')
+
+        return self._view(self._offset, tuple(self.shape[axis] for axis in axes),
+                          tuple(self.strides[axis] for axis in axes))
+
+    def fill(self, fill_value: T):
+        data = self._data
+        for position in self._positions():
+            data[position] = fill_value
+
+    def map(self, f: Callable[[T], U]) -> SliceableNDList[U]:
+        return self._from_flat([f(self._data[position]) for position in self._positions()], self.shape)
+
+    @classmethod
+    def uniform(cls, shape: Tuple[int, ...], fill_value: Optional[T] = None,
+                typecode: Optional[str] = None) -> SliceableNDList[T]:
+        size = reduce(operator.mul, shape, 1)
+        return cls._from_flat([fill_value] * size if typecode is None else array(typecode, [fill_value]) * size,
+                              tuple(shape))
+
+    def _index(self, index) -> Tuple[int, Tuple[int, ...], Tuple[int, ...]]:
+        index = index if isinstance(index, tuple) else (index,)
+        if len(index) > self.ndim:
+            raise IndexError(f'Too many indices for a {self.ndim}-dimensional list.')
+
+        offset = self._offset
+        shape = []
+        strides = []
+        for axis, (size, stride) in enumerate(zip(self.shape, self.strides)):
+            item = index[axis] if axis < len(index) else slice(None)
+            if isinstance(item, int):
+                if not -size <= item < size:
+                    raise IndexError(f'Index {item} is out of range for an axis of size {size}.')
+
+                offset += item % size * stride
+
+            elif isinstance(item, slice):
+                start, stop, step = item.indices(size)
+                offset += start * stride
+                shape.append(len(range(start, stop, step)))
+                strides.append(stride * step)
+
+            else:
+                raise TypeError(item)
+
+        return offset, tuple(shape), tuple(strides)
+
+    def _positions(self) -> Iterator[int]:
+        # Positions in the backing store, in row-major order.
+        *outer, (size, stride) = zip(self.shape, self.strides)
+        for starts in itertools.product(*([index * stride for index in range(size)] for size, stride in outer)):
+            start = self._offset + sum(starts)
+            yield from range(start, start + size * stride, stride)
+
+    def _view(self, offset: int, shape: Tuple[int, ...], strides: Tuple[int, ...]) -> SliceableNDList[T]:
+        view = self.__class__.__new__(self.__class__)
+        view._data = self._data
+        view._offset = offset
+        view.shape = shape
+        view.strides = strides
+        return view
+
+    @classmethod
+    def _from_flat(cls, data: Union[List[T], array], shape: Tuple[int, ...]) -> SliceableNDList[T]:
+        grid = cls.__new__(cls)
+        grid._data = data
+        grid._offset = 0
+        grid.shape = shape
+        grid.strides = cls._contiguous_strides(shape)
+        return grid
+
+    @staticmethod
+    def _empty(shape: Tuple[int, ...]) -> list:
+        # There's nothing to split up, but the outer axes still have to be there: a (2, 0) view is [[], []].
+        if len(shape) == 1 or shape[0] == 0:
+            return []
+
+        return [SliceableNDList._empty(shape[1:]) for _ in range(shape[0])]
+
+    @staticmethod
+    def _contiguous_strides(shape: Tuple[int, ...]) -> Tuple[int, ...]:
+        strides = [1]
+        for size in reversed(shape[1:]):
+            strides.append(strides[-1] * size)
+
+        return tuple(reversed(strides))
+
+    @staticmethod
+    def _flatten(data: Iterable, ndim: Optional[int] = None) -> Tuple[List, Tuple[int, ...]]:
+        # Without ndim, only lists (and SliceableNDLists) count as another level of nesting.
+        if isinstance(data, SliceableNDList):
+            data = data.values
+
+        elements = list(data)
+        if ndim == 1 or (ndim is None and not any(isinstance(element, (list, SliceableNDList))
+                                                   for element in elements)):
+            return elements, (len(elements),)
+
+        flattened = [SliceableNDList._flatten(element, None if ndim is None else ndim - 1) for element in elements]
+        shapes = {shape for _, shape in flattened}
+        if len(shapes) > 1:
+            raise TypeError('Got unevenly shaped data.')
+
+        inner_shape = shapes.pop() if shapes else (0,) * (ndim - 1)
+        return [element for part, _ in flattened for element in part], (len(elements), *inner_shape)
+
+    def __str__(self):
+        return str(self.values)
+
+    def __repr__(self):
+        return f'SliceableNDList({self.values})'
+
+
+class PriorityIndex(Generic[T]):
+    # Items by position, kept in shards of a few rows each. Like rows in Sliceable2DList, shards are shared between
+    # copies until one of them writes to it, so copying is O(shards) rather than O(items). Priorities are expected to be
+    # small integers, so ordering everything is a counting sort, done as it's iterated.
+
+    _SHARD_BITS = 4
+
+    def __init__(self, priority: Callable[[T], int]):
+        self._priority = priority
+        self._shards: Dict[int, Dict[Tuple[int, int], T]] = {}
+        self._owned: Set[int] = set()
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, position: Tuple[int, int]):
+        shard = self._shards.get(position[1] >> self._SHARD_BITS)
+        return shard is not None and position in shard
+
+    def __iter__(self) -> Iterator[Tuple[int, int, T]]:
+        buckets: Dict[int, List[Tuple[int, int, T]]] = {}
+        priority = self._priority
+        for key in sorted(self._shards):
+            for (x, y), item in self._shards[key].items():
+                buckets.setdefault(priority(item), []).append((x, y, item))
+
+        for bucket_priority in sorted(buckets, reverse=True):
+            yield from buckets[bucket_priority]
+
+    def put(self, x: int, y: int, item: T):
+        shard = self._writable_shard(y >> self._SHARD_BITS)
+        if (x, y) not in shard:
+            self._len += 1
+
+        shard[x, y] = item
+
+    def discard(self, x: int, y: int):
+        if (x, y) not in self:
+            return
+
+        key = y >> self._SHARD_BITS
+        shard = self._writable_shard(key)
+        del shard[x, y]
+        self._len -= 1
+        if not shard:
+            del self._shards[key]
+            self._owned.discard(key)
+
+    def copy(self) -> PriorityIndex[T]:
+        index = PriorityIndex(self._priority)
+        index._shards = dict(self._shards)
+        index._len = self._len
+        self._owned.clear()
+        return index
+
+    def _writable_shard(self, key: int) -> Dict[Tuple[int, int], T]:
+        if (shard := self._shards.get(key)) is None or key not in self._owned:
+            shard = self._shards[key] = {} if shard is None else dict(shard)
+            self._owned.add(key)
+
+        return shard
+
+
+class TimerWheel(Generic[T]):
+    # Items by the epoch they're due at, so nothing has to look at them until then. Buckets are shared between copies
+    # until one of them schedules something into it, like rows in Sliceable2DList, so copying is O(epochs) and not
+    # O(items).
+
+    def __init__(self):
+        self._buckets: Dict[int, List[T]] = {}
+        self._owned: Set[int] = set()
+
+    def __len__(self):
+        return sum(map(len, self._buckets.values()))
+
+    def __iter__(self) -> Iterator[Tuple[int, T]]:
+        for due in sorted(self._buckets):
+            for item in self._buckets[due]:
+                yield due, item
+
+    def schedule(self, due: int, item: T):
+        if (bucket := self._buckets.get(due)) is None or due not in self._owned:
+            bucket = self._buckets[due] = [] if bucket is None else list(bucket)
+            self._owned.add(due)
+
+        bucket.append(item)
+
+    def pop(self, due: int) -> List[T]:
+        self._owned.discard(due)
+        return self._buckets.pop(due, [])
+
+    def copy(self) -> TimerWheel[T]:
+        wheel = TimerWheel()
+        wheel._buckets = dict(self._buckets)
+        self._owned.clear()
+        return wheel
@@ -1,26 +1,50 @@
-import random
+import math
 from functools import reduce
-from typing import TypeVar, Sequence, Callable, Union, Iterable
+from typing import TypeVar, Sequence, Callable, Union, Iterable, Iterator
+
+from pydenim.services import rng
 
 T = TypeVar('T')
 
 
 def choice(seq: Sequence[T]) -> T:
-    return random.choice(seq)
+    return rng.choice(seq)
 
 
 def either(left: T, right: T) -> T:
-    return left if random.random() < 0.5 else right
+    return left if rng.random() < 0.5 else right
 
 
 def randint(low: int, high: int) -> int:
-    return random.randint(low, high)
+    return rng.randint(low, high)
+
+
+def bernoulli_indices(n: int, p: float) -> Iterator[int]:
+    # Equivalent to checking random() < p for each of range(n), but skips straight from one success to the next.
+    if p <= 0:
+        return
+
+    elif p >= 1:
+        yield from range(n)
+        return
+
+    log_failure = math.log(1 - p)
+    index = -1
+    while (index := index + 1 + int(math.log(1 - rng.random()) / log_failure)) < n:
+        yield index
 
 
 def orc(left: T, right: Union[T, Callable[[T], T]]) -> T:
     return right(left) if callable(right) else left or right
 
 
+def update(current: T, change: Union[None, T, Callable[[T], T]]) -> T:
+    if change is None:
+        return current
+
+    return change(current) if callable(change) else change
+
+
 def attrgettern(*attrs: Iterable[str]) -> Callable:
     def wrapped(value):
         return reduce(lambda intermediate, attr: getattr(intermediate, attr), attrs, value)
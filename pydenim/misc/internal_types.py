@@ -13,3 +13,43 @@ class Statistic(Enum):
 class Gender(Enum):
     Female = 1
     Male = 2
+
+
+class Neighbourhood(Enum):
+    VonNeumann = 1
+    Moore = 2
+
+
+class Engine(Enum):
+    Object = 1
+    Array = 2
+    # The object engine on a ChunkedGrid, for huge worlds that are mostly empty.
+    Chunked = 3
+
+
+class Outcome(Enum):
+    Ignore = 1
+    Move = 2
+    Eat = 3
+    Fight = 4
+    Mate = 5
+    Lay = 6
+
+
+class EventKind(Enum):
+    Birth = 1
+    Death = 2
+    Move = 3
+    Eat = 4
+    Fight = 5
+    Mate = 6
+    Lay = 7
+    Spawn = 8
+    Spoil = 9
+
+
+class Overflow(Enum):
+    # What an event log does with a new event when its buffer is full.
+    Block = 1
+    DropNewest = 2
+    DropOldest = 3
@@ -5,6 +5,8 @@ from typing import Tuple
 
 
 class BoardActor(metaclass=ABCMeta):
+    # Boards hold a lot of these, so none of them get a __dict__.
+    __slots__ = ('id',)
 
     def __init__(self, id: int):
         self.id = id
@@ -35,6 +37,7 @@ class BoardActor(metaclass=ABCMeta):
 
 
 class StaticActor(BoardActor):
+    __slots__ = ()
     interacts = False
     priority = 0
 
@@ -46,10 +49,12 @@ class StaticActor(BoardActor):
 
 
 class DynamicActor(BoardActor, metaclass=ABCMeta):
+    __slots__ = ()
     interacts = True
 
 
 class Creatable(metaclass=ABCMeta):
+    __slots__ = ()
 
     @classmethod
     @abstractmethod
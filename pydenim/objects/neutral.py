@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
-from pydenim.misc.constants import WALL_ID, OBSTACLE_ID, SPACE_ID, FOOD_CHANCE, EGG_LIFESPAN
-from pydenim.objects.base import BoardActor, Creatable, StaticActor
+from pydenim.misc.constants import WALL_ID, OBSTACLE_ID, SPACE_ID, EGG_LIFESPAN
+from pydenim.objects.base import Creatable, StaticActor
 from pydenim.services import id_generator
 
 if TYPE_CHECKING:
@@ -13,27 +12,63 @@ if TYPE_CHECKING:
 
 
 class Egg(StaticActor, Creatable):
+    # Like food, eggs don't count down themselves: the board hatches them once their lifespan is up.
+    #
+    # Eggs from mating are conceived with their parents' genomes, and the board breeds a whole batch of them at once
+    # (see fertilise). Anything that looks at one before then breeds it on its own.
+    __slots__ = ('_child_genome', 'parent_genomes', 'child_bio', 'lifespan')
     priority = 2
 
-    def __init__(self, id: int, child_genome: Genome, child_bio: Bio, lifespan: int):
+    def __init__(self, id: int, child_genome: Optional[Genome], child_bio: Bio, lifespan: int,
+                 parent_genomes: Optional[Tuple[Genome, Genome]] = None):
         self.id = id
-        self.child_genome = child_genome
+        self._child_genome = child_genome
+        self.parent_genomes = parent_genomes
         self.child_bio = child_bio
         self.lifespan = lifespan
         super().__init__(id)
 
-    def age(self) -> BoardActor:
-        return Egg(self.id, self.child_genome, self.child_bio, self.lifespan - 1) if self.lifespan > 0 else self.birth()
+    @property
+    def child_genome(self) -> Genome:
+        if self._child_genome is None:
+            self.fertilise([self])
+
+        return self._child_genome
+
+    def expire(self) -> Organism:
+        return self.birth()
 
     @classmethod
     def new(cls, child_genome: Genome, child_bio: Bio) -> Egg:
         return Egg(id_generator(), child_genome, child_bio, EGG_LIFESPAN)
 
+    @classmethod
+    def conceived(cls, parent_genomes: Tuple[Genome, Genome], child_bio: Bio) -> Egg:
+        return Egg(id_generator(), None, child_bio, EGG_LIFESPAN, parent_genomes)
+
+    def with_lifespan(self, lifespan: int) -> Egg:
+        # Passes the parents along too, so that an egg that hasn't been bred yet isn't bred here.
+        return Egg(self.id, self._child_genome, self.child_bio, lifespan, self.parent_genomes)
+
+    @staticmethod
+    def fertilise(eggs: Iterable[Egg]):
+        from pydenim.genetics.gene import Genome
+
+        pending = [egg for egg in eggs if egg._child_genome is None]
+        for egg, genome in zip(pending, Genome.breed([egg.parent_genomes for egg in pending])):
+            egg._child_genome = genome
+            egg.parent_genomes = None
+
     def birth(self) -> Organism:
+        from pydenim.objects.organism import Organism
+
         return Organism.new(self.child_genome, self.child_bio)
 
 
 class Food(StaticActor):
+    # lifespan is how many epochs the food had left when it was put down; the board schedules it to spoil after that
+    # rather than making a new Food every epoch to count it down.
+    __slots__ = ('lifespan', 'value')
 
     def __init__(self, id: int, lifespan: int, value: int):
         self.id = id
@@ -41,26 +76,22 @@ class Food(StaticActor):
         self.value = value
         super().__init__(id)
 
-    def age(self) -> BoardActor:
-        return Food(self.id, self.lifespan - 1, self.value) if self.lifespan > 0 else SPACE
+    def expire(self) -> Space:
+        return SPACE
 
 
 class Wall(StaticActor):
-    pass
+    __slots__ = ()
 
 
 class Obstacle(StaticActor):
-    pass
+    __slots__ = ()
 
 
 class Space(StaticActor):
+    __slots__ = ()
     priority = 1
 
-    def age(self) -> BoardActor:
-        lifespan = 10
-        value = 5
-        return Food(id_generator(), lifespan, value) if random.random() < FOOD_CHANCE else self
-
 
 WALL = Wall(id=WALL_ID)
 OBSTACLE = Obstacle(id=OBSTACLE_ID)
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from random import random
-from typing import Callable, Optional, Set, TYPE_CHECKING, Tuple, Union, cast
+from typing import Callable, FrozenSet, List, NamedTuple, Optional, TYPE_CHECKING, Tuple, Union, cast
 
 from pydenim.misc.constants import IGNORE_CHANCE, MATE_CHANCE
-from pydenim.misc.functional import attrgettern, either, orc
+from pydenim.misc.functional import attrgettern, either, update
 from pydenim.misc.internal_types import Gender
 from pydenim.objects.base import BoardActor, Creatable, DynamicActor
-from pydenim.objects.neutral import OBSTACLE, SPACE, WALL
-from pydenim.services import id_generator
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Egg, Food
+from pydenim.services import id_generator, lineage, rng
 
 if TYPE_CHECKING:
     from pydenim.genetics.gene import Genome
-    from pydenim.objects.neutral import Food, Space, Egg
+    from pydenim.objects.neutral import Space
+
+_UNCHANGED = object()
 
 
 class Organism(DynamicActor, Creatable):
+    __slots__ = ('genome', 'statistics', 'bio', 'effects', 'pregnant_with')
     active = True
 
     def __init__(self, id: int, genome: Genome, statistics: Statistics, bio: Bio, effects: Effects,
@@ -35,7 +36,9 @@ class Organism(DynamicActor, Creatable):
 
     @classmethod
     def new(cls, genome: Genome, bio: Bio) -> Organism:
-        return Organism(id_generator(), genome, genome.generate_statistics(), bio, set(), None)
+        id = id_generator()
+        lineage.record(id, bio.father_id, bio.mother_id, bio.gender)
+        return Organism(id, genome, genome.generate_statistics(), bio, NO_EFFECTS, None)
 
     def age(self) -> BoardActor:
         return self
@@ -48,7 +51,7 @@ class Organism(DynamicActor, Creatable):
 
             return either((cast(BoardActor, self), other), (other, self))
 
-        elif other in {WALL, OBSTACLE}:
+        elif other in {WALL, OBSTACLE} or isinstance(other, Egg):
             return self, other
 
         elif isinstance(other, Food):
@@ -61,16 +64,21 @@ class Organism(DynamicActor, Creatable):
             raise TypeError(other)
 
     def modify(self, genome: Optional[Genome] = None, statistics: Optional[Statistics] = None,
-               bio: Optional[Bio] = None, effects: Optional[Effects] = None, pregnant_with: Optional[Egg] = None):
-        return Organism(self.id, orc(genome, self.genome), orc(statistics, self.statistics), orc(bio, self.bio),
-                        orc(effects, self.effects), orc(pregnant_with, self.pregnant_with))
+               bio: Optional[Bio] = None, effects: Optional[Effects] = None,
+               pregnant_with: Union[Optional[Egg], object] = _UNCHANGED):
+        # pregnant_with=None clears the pregnancy, so leaving it alone needs a sentinel of its own.
+        if pregnant_with is _UNCHANGED:
+            pregnant_with = self.pregnant_with
+
+        return Organism(self.id, update(self.genome, genome), update(self.statistics, statistics),
+                        update(self.bio, bio), update(self.effects, effects), pregnant_with)
 
     def _eat(self, other: Food) -> Tuple[Space, Organism]:
         new_self = self.modify(statistics=self.statistics.modify(health=lambda health: health + other.value))
         return SPACE, new_self
 
     def _interact_organism(self, other: Organism) -> Tuple[BoardActor, BoardActor]:
-        action_score = random.random()
+        action_score = rng.random()
         if action_score < IGNORE_CHANCE:
             return self, other
 
@@ -101,28 +109,35 @@ class Organism(DynamicActor, Creatable):
         return first.modify(statistics=new_first_stats), second.modify(statistics=new_second_stats)
 
     def _mate(self, other: Organism) -> Tuple[Organism, Organism]:
-        child_genome = self.genome ^ other.genome
+        # The child's genome is left to the board, which breeds everything conceived in a batch at once.
+        parent_genomes = (self.genome, other.genome)
         # noinspection PyTypeChecker
-        child_gender = Gender(random.randint(1, len(Gender)))
+        child_gender = Gender(rng.randint(1, len(Gender)))
 
         if self.bio.gender is Gender.Female:
-            child_bio = Bio(other, self, child_gender)
-            return self.modify(pregnant_with=Egg.new(child_genome, child_bio)), other
+            child_bio = Bio(other.id, self.id, child_gender)
+            return self.modify(pregnant_with=Egg.conceived(parent_genomes, child_bio)), other
 
         else:
-            child_bio = Bio(self, other, child_gender)
-            return self, other.modify(pregnant_with=Egg.new(child_genome, child_bio))
+            child_bio = Bio(self.id, other.id, child_gender)
+            return self, other.modify(pregnant_with=Egg.conceived(parent_genomes, child_bio))
+
+
+def conceptions(*actors: BoardActor) -> List[Egg]:
+    # Eggs conceived by these actors that haven't been bred yet.
+    return [actor.pregnant_with for actor in actors
+            if isinstance(actor, Organism) and actor.pregnant_with and actor.pregnant_with.parent_genomes]
 
 
-@dataclass(frozen=True)
-class Bio:
-    father: Organism
-    mother: Organism
+class Bio(NamedTuple):
+    # Parents are only referenced by ID (see services.lineage), so that holding on to an organism doesn't hold on to
+    # all of its ancestors.
+    father_id: Optional[int]
+    mother_id: Optional[int]
     gender: Gender
 
 
-@dataclass(frozen=True)
-class Statistics:
+class Statistics(NamedTuple):
     strength: int
     agility: int
     constitution: int
@@ -131,8 +146,8 @@ class Statistics:
     def modify(self, strength: Statistic = None, agility: Statistic = None, constitution: Statistic = None,
                health: Statistic = None):
         # I wish I had type lambdas.
-        return Statistics(orc(strength, self.strength), orc(agility, self.agility),
-                          orc(constitution, self.constitution), orc(health, self.health))
+        return Statistics(update(self.strength, strength), update(self.agility, agility),
+                          update(self.constitution, constitution), update(self.health, health))
 
 
 class Effect(metaclass=ABCMeta):
@@ -149,5 +164,6 @@ class Effect(metaclass=ABCMeta):
         return isinstance(other, Effect) and self.name == other.name
 
 
-Effects = Set[Effect]
+Effects = FrozenSet[Effect]
+NO_EFFECTS: Effects = frozenset()
 Statistic = Optional[Union[int, Callable[[int], int]]]
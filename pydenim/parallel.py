@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pydenim.array_board import EGG_KIND, ORGANISM_KIND, ArrayBoard, Positions, age_cells
+from pydenim.config import Config
+from pydenim.objects.base import BoardActor
+from pydenim.objects.organism import Organism, Statistics
+from pydenim.services import IdGenerator, Key, id_generator, lineage, rng
+
+ARRAYS = ('kinds', 'lifespans', 'values', 'ids')
+
+# Only ever populated in worker processes.
+_arrays: Dict[str, np.ndarray] = {}
+_memory: List[SharedMemory] = []
+_config: Optional[Config] = None
+# The eggs and organisms on this worker's tiles. They stay here between epochs, so only what changes is ever sent.
+_objects: Dict[int, BoardActor] = {}
+# What aging left for each tile to finish once it has its IDs: (living, hatching, spawned).
+_aged: Dict[int, Tuple[Positions, Positions, Positions]] = {}
+
+
+class Tile(NamedTuple):
+    index: int
+    y_min: int
+    y_max: int
+    x_min: int
+    x_max: int
+
+
+class _Recording(dict):
+    # Remembers which objects were written through it (but not by update), so that whatever the halo changes can be
+    # sent on to the workers.
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.written = set()
+
+    def __setitem__(self, id: int, actor: BoardActor):
+        super().__setitem__(id, actor)
+        self.written.add(id)
+
+
+class TiledStepper:
+    # Steps an ArrayBoard in place on a set of worker processes, with the board's arrays in shared memory.
+    #
+    # The board is split into tiles, and every tile belongs to one worker for good. Each worker keeps the eggs and
+    # organisms on its tiles, so an epoch takes two round trips with almost nothing in them: one to age the tiles, which
+    # says how many IDs each one needs, and one to hatch, age and interact, which sends back only the objects that
+    # changed. Interactions only ever reach the four orthogonal neighbours, so an organism at least one cell away from
+    # the edge of its tile can only touch its own tile. Organisms on that one-cell halo may reach into another tile, so
+    # they are held back and run afterwards on this process, in priority order (ties going to the first in row-major
+    # order), and whatever they change goes out to the workers with the next epoch.
+    #
+    # Every tile draws from its own substream of the RNG service, keyed by (epoch, tile), and gets its own block of IDs,
+    # handed out in tile order, so results depend on the seed and the tile shape but not on the number of workers.
+
+    def __init__(self, board: ArrayBoard, tile_shape: Tuple[int, int] = (256, 256), n_workers: Optional[int] = None):
+        self.board = board
+        self.tile_shape = tile_shape
+        self.tiles = list(self._split(board.kinds.shape, tile_shape))
+        self._tile_bounds = np.array([tile[1:] for tile in self.tiles]).reshape(-1, 4)
+        self._memory: List[SharedMemory] = []
+        specs = {}
+        for name in ARRAYS:
+            array = getattr(board, name)
+            memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared = np.ndarray(array.shape, array.dtype, buffer=memory.buf)
+            shared[...] = array
+            setattr(board, name, shared)
+            self._memory.append(memory)
+            specs[name] = (memory.name, array.shape, array.dtype.str)
+
+        n_workers = min(n_workers or os.cpu_count() or 1, len(self.tiles))
+        self._owned = [list(range(worker, len(self.tiles), n_workers)) for worker in range(n_workers)]
+        board.objects = _Recording(board.objects)
+        by_tile = self._by_tile(board.objects)
+        self._pools = [ProcessPoolExecutor(1, initializer=_attach,
+                                           initargs=(specs, board.config, {id: actor for index in owned
+                                                                           for id, actor in by_tile[index].items()}))
+                       for owned in self._owned]
+        self._updates: List[Dict[int, BoardActor]] = [{} for _ in self.tiles]
+
+    def __enter__(self) -> TiledStepper:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def step(self) -> ArrayBoard:
+        board = self.board
+        epoch = board.epoch + 1
+        lineage.advance(epoch)
+        streams = [(rng.seed, rng.key + (board.epoch, tile.index)) for tile in self.tiles]
+        counts = self._map(_age_tiles, streams, self._updates)
+        blocks = [id_generator.reserve(count) for count in counts]
+        objects = board.objects
+        for changed, restated, births in self._map(_step_tiles, streams, blocks):
+            objects.update(changed)
+            objects.update((id, _restate(objects[id], statistics)) for id, *statistics in restated)
+            for id in births:
+                bio = objects[id].bio
+                lineage.record(id, bio.father_id, bio.mother_id, bio.gender)
+
+        ys, xs = np.nonzero(board.kinds == ORGANISM_KIND)
+        interior = self._interior(ys, xs, self._tile_indices(ys, xs))
+        objects.written.clear()
+        with rng.substream(board.epoch, 'halo'):
+            board._interact((ys[~interior], xs[~interior]))
+
+        self._updates = self._by_tile(objects, objects.written)
+        board.objects = _Recording(self._live(objects))
+        board.epoch = epoch
+        return board
+
+    def close(self):
+        for pool in self._pools:
+            pool.shutdown()
+
+        for name in ARRAYS:
+            setattr(self.board, name, getattr(self.board, name).copy())
+
+        self.board.objects = dict(self.board.objects)
+        for memory in self._memory:
+            memory.close()
+            memory.unlink()
+
+        self._memory = []
+
+    def _map(self, function: Callable[..., list], *per_tile: Sequence) -> list:
+        # Calls function once on each worker, with its own tiles and their share of each argument, and puts the results
+        # back in tile order.
+        futures = [pool.submit(function, [self.tiles[index] for index in owned],
+                               *([arg[index] for index in owned] for arg in per_tile))
+                   for pool, owned in zip(self._pools, self._owned)]
+        results = [None] * len(self.tiles)
+        for future, owned in zip(futures, self._owned):
+            for index, result in zip(owned, future.result()):
+                results[index] = result
+
+        return results
+
+    def _objects_at(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        kinds = self.board.kinds
+        ys, xs = np.nonzero((kinds == EGG_KIND) | (kinds == ORGANISM_KIND))
+        return ys, xs, self.board.ids[ys, xs]
+
+    def _live(self, objects: Dict[int, BoardActor]) -> Dict[int, BoardActor]:
+        # Only what's still on the board.
+        _, _, ids = self._objects_at()
+        return {id: objects[id] for id in ids.tolist()}
+
+    def _by_tile(self, objects: Dict[int, BoardActor], only: Optional[set] = None) -> List[Dict[int, BoardActor]]:
+        ys, xs, ids = self._objects_at()
+        if only is not None:
+            wanted = np.isin(ids, np.fromiter(only, np.int64, len(only)))
+            ys, xs, ids = ys[wanted], xs[wanted], ids[wanted]
+
+        grouped: List[Dict[int, BoardActor]] = [{} for _ in self.tiles]
+        for id, index in zip(ids.tolist(), self._tile_indices(ys, xs).tolist()):
+            grouped[index][id] = objects[id]
+
+        return grouped
+
+    def _tile_indices(self, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+        tile_rows, tile_cols = self.tile_shape
+        n_tile_cols = -(-self.board.kinds.shape[1] // tile_cols)
+        return ys // tile_rows * n_tile_cols + xs // tile_cols
+
+    def _interior(self, ys: np.ndarray, xs: np.ndarray, tile_indices: np.ndarray) -> np.ndarray:
+        y_min, y_max, x_min, x_max = self._tile_bounds[tile_indices].T
+        return (ys > y_min) & (ys < y_max - 1) & (xs > x_min) & (xs < x_max - 1)
+
+    @staticmethod
+    def _split(shape: Tuple[int, int], tile_shape: Tuple[int, int]) -> Iterator[Tile]:
+        n_rows, n_cols = shape
+        tile_rows, tile_cols = tile_shape
+        corners = ((y, x) for y in range(0, n_rows, tile_rows) for x in range(0, n_cols, tile_cols))
+        for index, (y, x) in enumerate(corners):
+            yield Tile(index, y, min(y + tile_rows, n_rows), x, min(x + tile_cols, n_cols))
+
+
+def _attach(specs: Dict[str, Tuple[str, Tuple[int, int], str]], config: Config, objects: Dict[int, BoardActor]):
+    global _config
+    for name, (memory_name, shape, dtype) in specs.items():
+        memory = SharedMemory(memory_name)
+        _memory.append(memory)
+        _arrays[name] = np.ndarray(shape, np.dtype(dtype), buffer=memory.buf)
+
+    _config = config
+    _objects.update(objects)
+    # Births are recorded on the main process, so this process' store only has to forget them again.
+    lineage.retention = 0
+
+
+def _window(tile: Tile) -> Tuple[np.ndarray, ...]:
+    return tuple(_arrays[name][tile.y_min:tile.y_max, tile.x_min:tile.x_max] for name in ARRAYS)
+
+
+def _window_ids(tile: Tile) -> List[int]:
+    kinds, _, _, ids = _window(tile)
+    return ids[(kinds == EGG_KIND) | (kinds == ORGANISM_KIND)].tolist()
+
+
+def _offset(positions: Positions, y: int, x: int) -> Positions:
+    ys, xs = positions
+    return ys + y, xs + x
+
+
+def _age_tiles(tiles: List[Tile], streams: List[Tuple[int, Key]], updates: List[Dict[int, BoardActor]]) -> List[int]:
+    # Ages each tile, and says how many IDs it will need to finish: one per food spawned and per egg hatched, and one
+    # per organism that might conceive.
+    counts = []
+    for tile, (seed, key), tile_updates in zip(tiles, streams, updates):
+        _objects.update(tile_updates)
+        window = _window(tile)
+        living = _offset(np.nonzero(window[0] == ORGANISM_KIND), tile.y_min, tile.x_min)
+        rng.reseed(seed, key + ('age',))
+        hatching, spawned = (_offset(positions, tile.y_min, tile.x_min)
+                             for positions in age_cells(*window, rng.numpy()))
+        _aged[tile.index] = living, hatching, spawned
+        counts.append(len(living[0]) + 2 * len(hatching[0]) + len(spawned[0]))
+
+    return counts
+
+
+def _step_tiles(tiles: List[Tile], streams: List[Tuple[int, Key]],
+                blocks: List[IdGenerator]) -> List[Tuple[Dict[int, BoardActor], List[tuple], List[int]]]:
+    # Hatches, ages and interacts each tile, then sends back what changed. Organisms that only ate or fought go as rows
+    # of (ID, *statistics), since the main process already has everything else about them, and the rest go whole.
+    # Births are listed by ID as well, for the lineage.
+    board = ArrayBoard(_config, *(_arrays[name] for name in ARRAYS), _objects)
+    results = []
+    for tile, (seed, key), ids in zip(tiles, streams, blocks):
+        before = {id: _objects[id] for id in _window_ids(tile)}
+        id_generator.restore(ids.checkpoint())
+        board._settle(*_aged.pop(tile.index))
+        rng.reseed(seed, key + ('interact',))
+        kinds = _window(tile)[0]
+        board._interact(_offset(np.nonzero(kinds[1:-1, 1:-1] == ORGANISM_KIND), tile.y_min + 1, tile.x_min + 1))
+        changed, restated = {}, []
+        for id in _window_ids(tile):
+            actor, old = _objects[id], before.get(id)
+            if actor is old:
+                continue
+
+            elif _only_statistics_changed(actor, old):
+                restated.append((id, *actor.statistics))
+
+            else:
+                changed[id] = actor
+
+        births = [id for id, actor in changed.items() if id not in before and isinstance(actor, Organism)]
+        results.append((changed, restated, births))
+
+    live = {id for tile in tiles for id in _window_ids(tile)}
+    for id in _objects.keys() - live:
+        del _objects[id]
+
+    lineage.advance(lineage.epoch + 1)
+    return results
+
+
+def _only_statistics_changed(actor: BoardActor, old: Optional[BoardActor]) -> bool:
+    return isinstance(actor, Organism) and isinstance(old, Organism) and actor.genome is old.genome \
+        and actor.bio is old.bio and actor.effects is old.effects and actor.pregnant_with is old.pregnant_with
+
+
+def _restate(organism: Organism, statistics: Sequence[int]) -> Organism:
+    return Organism(organism.id, organism.genome, Statistics._make(statistics), organism.bio, organism.effects,
+                    organism.pregnant_with)
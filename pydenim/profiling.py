@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, Iterator, List, NamedTuple, Sequence
+
+from pydenim.misc.internal_types import Outcome
+from pydenim.objects.base import BoardActor
+from pydenim.objects.neutral import SPACE, Egg, Food
+from pydenim.objects.organism import Organism
+from pydenim.services import id_generator
+
+if TYPE_CHECKING:
+    from pydenim.board import PositionedBoardActor
+
+PHASES = ('spawn', 'expire', 'age', 'schedule', 'interact', 'write')
+
+
+class EpochMetrics(NamedTuple):
+    epoch: int
+    # Wall time spent in each phase, in seconds.
+    phases: Dict[str, float]
+    interactions: Dict[Outcome, int]
+    births: int
+    deaths: int
+    # IDs handed out, i.e. new food, eggs and organisms (but not new versions of old ones).
+    allocations: int
+
+    @property
+    def duration(self) -> float:
+        return sum(self.phases.values())
+
+
+Hook = Callable[[EpochMetrics], None]
+
+
+class Profiler:
+    # Times the phases of an epoch and counts what happened in it, then hands the lot to each hook once the epoch is
+    # over. Boards use NO_PROFILER unless given one, which does none of that.
+    enabled = True
+
+    def __init__(self, *hooks: Hook):
+        self.hooks = list(hooks)
+        self.start(0)
+
+    def start(self, epoch: int):
+        self._epoch = epoch
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self._interactions: Counter[Outcome] = Counter()
+        self._births = 0
+        self._deaths = 0
+        self._ids = id_generator.count
+
+    def finish(self) -> EpochMetrics:
+        metrics = EpochMetrics(self._epoch, self._phases, dict(self._interactions), self._births, self._deaths,
+                               id_generator.count - self._ids)
+        for hook in self.hooks:
+            hook(metrics)
+
+        return metrics
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+
+        finally:
+            self._phases[name] += time.perf_counter() - start
+
+    def interactions(self, before: Sequence[BoardActor], after: Sequence[BoardActor]):
+        # Both are flat, with each actor followed by its neighbour, the way the board writes them.
+        for index in range(0, len(before), 2):
+            outcome = classify(before[index], before[index + 1], after[index], after[index + 1])
+            self._interactions[outcome] += 1
+            if outcome is Outcome.Fight:
+                self._deaths += (after[index] is SPACE) + (after[index + 1] is SPACE)
+
+    def expired(self, expiring: Sequence[PositionedBoardActor]):
+        # What's expiring is what it expired into, so anything hatched is now an organism.
+        self._births += sum(isinstance(actor, Organism) for _, _, actor in expiring)
+
+
+class NullProfiler(Profiler):
+    enabled = False
+
+    def __init__(self):
+        super().__init__()
+        self._phase = nullcontext()
+
+    def start(self, epoch: int):
+        pass
+
+    def finish(self) -> None:
+        pass
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return self._phase
+
+    def interactions(self, before: Sequence[BoardActor], after: Sequence[BoardActor]):
+        pass
+
+    def expired(self, expiring: Sequence[PositionedBoardActor]):
+        pass
+
+
+class MetricsCollector:
+    # The simplest hook there is: holds on to everything it's given.
+
+    def __init__(self):
+        self.epochs: List[EpochMetrics] = []
+
+    def __call__(self, metrics: EpochMetrics):
+        self.epochs.append(metrics)
+
+    def totals(self) -> EpochMetrics:
+        phases: Counter[str] = Counter(dict.fromkeys(PHASES, 0.0))
+        interactions: Counter[Outcome] = Counter()
+        for metrics in self.epochs:
+            phases.update(metrics.phases)
+            interactions.update(metrics.interactions)
+
+        return EpochMetrics(len(self.epochs), dict(phases), dict(interactions),
+                            sum(metrics.births for metrics in self.epochs),
+                            sum(metrics.deaths for metrics in self.epochs),
+                            sum(metrics.allocations for metrics in self.epochs))
+
+
+def classify(actor: BoardActor, neighbour: BoardActor, new_actor: BoardActor, new_neighbour: BoardActor) -> Outcome:
+    # Works out what an interaction was from what it did, so that Organism.interact doesn't have to report anything.
+    if isinstance(neighbour, Food):
+        return Outcome.Eat
+
+    elif neighbour is SPACE:
+        if new_actor is SPACE:
+            return Outcome.Move
+
+        elif isinstance(new_neighbour, Egg):
+            return Outcome.Lay
+
+        return Outcome.Ignore
+
+    elif isinstance(neighbour, Organism):
+        if new_actor is actor and new_neighbour is neighbour:
+            return Outcome.Ignore
+
+        # Fights never get anyone pregnant, but they might kill someone who was.
+        elif _pregnancies(new_actor, new_neighbour) > _pregnancies(actor, neighbour):
+            return Outcome.Mate
+
+        return Outcome.Fight
+
+    return Outcome.Ignore
+
+
+def _pregnancies(*actors: BoardActor) -> int:
+    return sum(isinstance(actor, Organism) and actor.pregnant_with is not None for actor in actors)
+
+
+NO_PROFILER = NullProfiler()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, NamedTuple, Optional, Tuple, Union
+
+from pydenim.board import Board
+from pydenim.objects.base import BoardActor
+from pydenim.renderer.base import Renderer
+
+if TYPE_CHECKING:
+    from pydenim.array_board import ArrayBoard
+
+Message = Callable[[], None]
+# When it was submitted, and the board.
+Frame = Tuple[float, Union[Board, 'ArrayBoard']]
+
+
+class FrameMetrics(NamedTuple):
+    submitted: int
+    drawn: int
+    # Replaced by a newer frame before the worker got to them, or turned away while it was busy.
+    dropped: int
+    # Drawn, but more than lag_threshold seconds after they were submitted.
+    lagging: int
+    # Seconds from submission to being drawn, at worst.
+    max_lag: float
+
+
+class BackgroundRenderer(Renderer):
+    # Hands boards over to a worker thread that draws them with another renderer, so the simulation never waits for a
+    # slow terminal (or file). There's only ever one frame waiting: a newer one replaces it, so the worker always draws
+    # the latest board it can. Text and actors are never dropped, and are drawn in order before the next frame.
+    #
+    # Boards stepped in place have to be snapshotted before they're handed over, so that they can keep changing while
+    # they're drawn. That isn't free, so with snapshot on, frames that come in while the worker is busy are dropped
+    # straight away, without one. Boards from age() never change, so with snapshot off they're queued as they are.
+    #
+    # If the wrapped renderer raises, the worker stops, and the error is raised from the next call on this side.
+
+    def __init__(self, renderer: Renderer, snapshot: bool = True, lag_threshold: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.renderer = renderer
+        self.snapshot = snapshot
+        self.lag_threshold = lag_threshold
+        self.clock = clock
+        self.submitted = 0
+        self.drawn = 0
+        self.dropped = 0
+        self.lagging = 0
+        self.max_lag = 0.0
+        self._frame: Optional[Frame] = None
+        self._messages: Deque[Message] = deque()
+        self._closing = False
+        self._busy = False
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._worker = threading.Thread(target=self._run, name='renderer', daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> BackgroundRenderer:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def render_board(self, board: Union[Board, ArrayBoard]):
+        submitted = self.clock()
+        with self._lock:
+            self._raise()
+            self.submitted += 1
+            if self.snapshot and self._busy:
+                self.dropped += 1
+                return
+
+        if self.snapshot:
+            # The worker is idle, so it's only waiting on this.
+            board = board.snapshot()
+
+        with self._lock:
+            if self._frame is not None:
+                self.dropped += 1
+
+            self._frame = (submitted, board)
+            self._ready.notify()
+
+    def render_actor(self, actor: BoardActor):
+        self._send(lambda: self.renderer.render_actor(actor))
+
+    def render_text(self, text: str):
+        self._send(lambda: self.renderer.render_text(text))
+
+    def convert_actor(self, actor: BoardActor):
+        return self.renderer.convert_actor(actor)
+
+    def metrics(self) -> FrameMetrics:
+        with self._lock:
+            return FrameMetrics(self.submitted, self.drawn, self.dropped, self.lagging, self.max_lag)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        # Until everything submitted so far has been drawn or dropped.
+        with self._lock:
+            done = self._idle.wait_for(lambda: self._error is not None
+                                       or not (self._frame or self._messages or self._busy), timeout)
+            self._raise()
+            return done
+
+    def close(self):
+        # Draws whatever is still waiting first.
+        with self._lock:
+            self._closing = True
+            self._ready.notify()
+
+        self._worker.join()
+        self._raise()
+
+    def _send(self, message: Message):
+        with self._lock:
+            self._raise()
+            self._messages.append(message)
+            self._ready.notify()
+
+    def _raise(self):
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._ready.wait_for(lambda: self._closing or self._frame or self._messages)
+                if not (self._frame or self._messages):
+                    self._idle.notify_all()
+                    return
+
+                messages, frame = list(self._messages), self._frame
+                self._messages.clear()
+                self._frame = None
+                self._busy = True
+
+            try:
+                for message in messages:
+                    message()
+
+                if frame is not None:
+                    submitted, board = frame
+                    self.renderer.render_board(board)
+                    lag = self.clock() - submitted
+                    with self._lock:
+                        self.drawn += 1
+                        self.lagging += lag > self.lag_threshold
+                        self.max_lag = max(self.max_lag, lag)
+
+            except Exception as error:
+                self._error = error
+
+            finally:
+                with self._lock:
+                    self._busy = False
+                    self._idle.notify_all()
+
+            if self._error is not None:
+                return
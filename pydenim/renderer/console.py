@@ -1,4 +1,6 @@
-from typing import Mapping, Type
+import sys
+import time
+from typing import Callable, List, Mapping, NamedTuple, Optional, TextIO, Tuple, Type
 
 from pydenim.board import Board
 from pydenim.objects.base import BoardActor
@@ -6,6 +8,16 @@ from pydenim.objects.neutral import Egg, Food, Obstacle, Space, Wall
 from pydenim.objects.organism import Organism
 from pydenim.renderer.base import Renderer
 
+CLEAR = '\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+
+
+class Viewport(NamedTuple):
+    x: int
+    y: int
+    n_cols: int
+    n_rows: int
+
 
 class ConsoleRenderer(Renderer):
     _RENDER_MAP: Mapping[Type[BoardActor], str] = {
@@ -28,3 +40,86 @@ class ConsoleRenderer(Renderer):
 
     def convert_actor(self, obj: BoardActor):
         return self._RENDER_MAP[type(obj)]
+
+
+class IncrementalConsoleRenderer(ConsoleRenderer):
+    # Draws the board in place on an ANSI terminal. It keeps the last frame it drew and only rewrites the cells that
+    # changed since, all in a single write. Frames that come in faster than fps are skipped (unless forced), and with a
+    # viewport only that part of the board is ever looked at.
+
+    def __init__(self, stream: TextIO = sys.stdout, fps: Optional[float] = 30, viewport: Optional[Viewport] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.stream = stream
+        self.fps = fps
+        self.viewport = viewport
+        self.clock = clock
+        self.drawn = 0
+        self.skipped = 0
+        self._last_drawn: Optional[float] = None
+        self._frame: List[str] = []
+        self._region: Optional[Viewport] = None
+
+    def render_board(self, board: Board, force: bool = False) -> bool:
+        now = self.clock()
+        if not force and self.fps and self._last_drawn is not None and now - self._last_drawn < 1 / self.fps:
+            self.skipped += 1
+            return False
+
+        region = self._clip(board)
+        x, y, n_cols, n_rows = region
+        convert = self._RENDER_MAP.__getitem__
+        frame = [''.join(map(convert, map(type, row))) for row in board[x:x + n_cols, y:y + n_rows].values]
+        if region != self._region:
+            # Nothing on screen can be reused, so start again from a blank one.
+            self._frame = [' ' * n_cols] * n_rows
+            parts = [CLEAR]
+
+        else:
+            parts = []
+
+        for row_index, (old, new) in enumerate(zip(self._frame, frame), 1):
+            if old != new:
+                for start, stop in self._changes(old, new):
+                    parts.append(f'\x1b[{row_index};{start + 1}H{new[start:stop]}')
+
+        if parts:
+            # Leave the cursor under the board, where render_text writes.
+            parts.append(f'\x1b[{n_rows + 1};1H')
+            self.stream.write(''.join(parts))
+            self.stream.flush()
+
+        self._frame = frame
+        self._region = region
+        self._last_drawn = now
+        self.drawn += 1
+        return True
+
+    def render_text(self, text: str):
+        # Printing would scroll the board out from under the frame, so write over the line below it instead.
+        n_rows = self._region.n_rows if self._region else 0
+        self.stream.write(f'\x1b[{n_rows + 1};1H{text}{CLEAR_LINE}')
+        self.stream.flush()
+
+    def _clip(self, board: Board) -> Viewport:
+        n_rows, n_cols = board.config.n_rows, board.config.n_cols
+        if self.viewport is None:
+            return Viewport(0, 0, n_cols, n_rows)
+
+        x, y, width, height = self.viewport
+        x, y = min(max(x, 0), n_cols), min(max(y, 0), n_rows)
+        return Viewport(x, y, min(width, n_cols - x), min(height, n_rows - y))
+
+    @staticmethod
+    def _changes(old: str, new: str) -> List[Tuple[int, int]]:
+        # Runs of changed characters, with gaps of a few unchanged ones merged in, since moving the cursor takes more
+        # characters than just writing them again.
+        runs: List[Tuple[int, int]] = []
+        for index, (old_char, new_char) in enumerate(zip(old, new)):
+            if old_char != new_char:
+                if runs and index - runs[-1][1] < 8:
+                    runs[-1] = (runs[-1][0], index + 1)
+
+                else:
+                    runs.append((index, index + 1))
+
+        return runs
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from pydenim.objects.base import DynamicActor
+
+Cell = Tuple[int, int]
+
+
+class Interaction(NamedTuple):
+    actor_x: int
+    actor_y: int
+    actor: DynamicActor
+    neighbour_x: int
+    neighbour_y: int
+
+    @property
+    def cells(self) -> Tuple[Cell, Cell]:
+        return (self.actor_x, self.actor_y), (self.neighbour_x, self.neighbour_y)
+
+
+def schedule(interactions: Iterable[Interaction]) -> List[List[Interaction]]:
+    # Splits interactions, given in priority order, into batches that touch disjoint cells. Each one goes in the batch
+    # after the last one to touch either of its cells, so any two that share a cell still happen in priority order, and
+    # running the batches one after the other is the same as running all the interactions in order.
+    batches: List[List[Interaction]] = []
+    last_batches: Dict[Cell, int] = {}
+    for interaction in interactions:
+        cells = interaction.cells
+        batch = max(last_batches.get(cell, -1) for cell in cells) + 1
+        if batch == len(batches):
+            batches.append([])
+
+        batches[batch].append(interaction)
+        for cell in cells:
+            last_batches[cell] = batch
+
+    return batches
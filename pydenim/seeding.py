@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Union
+
+from pydenim.config import Config
+from pydenim.genetics.gene import STATISTICS, Gene, Genome, Modifier
+from pydenim.misc.constants import FOUNDER_GENES, MAX_MODIFIER_AMOUNT, MAX_MODIFIERS, MIN_MODIFIER_AMOUNT, \
+    MIN_MODIFIERS
+from pydenim.misc.functional import bernoulli_indices
+from pydenim.misc.internal_types import Engine, Gender
+from pydenim.objects.organism import NO_EFFECTS, Bio, Organism
+from pydenim.services import gene_pool, id_generator, lineage, rng
+from pydenim.topology import Topology
+
+if TYPE_CHECKING:
+    import numpy as np
+
+GENDERS = list(Gender)
+
+
+class Seeding(NamedTuple):
+    # Where everything goes in a new world, as flat indices into the whole grid (y * n_cols + x), so that either engine
+    # can scatter it in one pass. The array engine gets its obstacles as an array.
+    obstacles: Union[List[int], np.ndarray]
+    positions: List[int]
+    organisms: List[Organism]
+
+
+def seed_world(config: Config) -> Seeding:
+    n_rows, n_cols = config.n_rows, config.n_cols
+    margin = Topology.of(config).margin
+    inner_cols = n_cols - 2 * margin
+    n_cells = max(n_rows - 2 * margin, 0) * max(inner_cols, 0)
+    if config.starting_organism_count > n_cells:
+        raise ValueError(f'Could not fit {config.starting_organism_count} organisms into {n_cells} cells.')
+
+    def to_flat(index: int) -> int:
+        y, x = divmod(index, inner_cols)
+        return (y + margin) * n_cols + x + margin
+
+    with _paused_gc():
+        positions = rng.sample(range(n_cells), config.starting_organism_count)
+        # Obstacles come from a substream of their own, so that each engine can draw them however suits it and still
+        # leave the main stream where the other one would.
+        with rng.substream('obstacles', rng.getrandbits(64)):
+            if config.engine is Engine.Array:
+                obstacles = _array_obstacles(n_rows, n_cols, margin, config.obstacle_chance, positions)
+
+            else:
+                taken = set(positions)
+                obstacles = [to_flat(index) for index in bernoulli_indices(n_cells, config.obstacle_chance)
+                             if index not in taken]
+
+        organisms = found(config.starting_organism_count, config.genes_per_organism)
+
+    return Seeding(obstacles, list(map(to_flat, positions)), organisms)
+
+
+def _array_obstacles(n_rows: int, n_cols: int, margin: int, chance: float, positions: List[int]) -> np.ndarray:
+    # Same as the object engine's, but in bulk: a huge world would otherwise make millions of draws one at a time.
+    import numpy as np
+
+    inner_cols = n_cols - 2 * margin
+    n_cells = (n_rows - 2 * margin) * inner_cols
+    generator = rng.numpy()
+    if chance <= 0:
+        indices = np.empty(0, dtype=np.int64)
+
+    elif chance >= 1:
+        indices = np.arange(n_cells)
+
+    else:
+        # The gaps between successes are geometric, so draw those (in batches a little bigger than the expected number
+        # of successes) rather than a number per cell.
+        batches, last = [], -1
+        while last < n_cells:
+            batch = last + np.cumsum(generator.geometric(chance, int(n_cells * chance * 1.1) + 16))
+            batches.append(batch)
+            last = batch[-1]
+
+        indices = np.concatenate(batches)
+        indices = indices[indices < n_cells]
+
+    indices = indices[~np.isin(indices, positions)]
+    ys, xs = np.divmod(indices, inner_cols)
+    return (ys + margin) * n_cols + xs + margin
+
+
+def found(n: int, genes_per_organism: int) -> List[Organism]:
+    # Founders draw their genes from a small shared set, which is both quicker than making up 5 genes per organism and
+    # much kinder to the gene pool.
+    genes = rng.choices(list(map(gene_pool.intern, founder_genes())), k=n * genes_per_organism)
+    genomes = [Genome.from_pooled(genes[start:start + genes_per_organism])
+               for start in range(0, len(genes), genes_per_organism)]
+    genders = rng.choices(GENDERS, k=n)
+    ids = id_generator.allocate(n)
+    lineage.record_founders(ids, genders)
+    bios = {gender: Bio(None, None, gender) for gender in Gender}
+    return [Organism(id, genome, genome.generate_statistics(), bios[gender], NO_EFFECTS, None)
+            for id, genome, gender in zip(ids, genomes, genders)]
+
+
+def founder_genes(n: int = FOUNDER_GENES) -> List[Gene]:
+    return [Gene([Modifier(rng.choice(STATISTICS), rng.randint(MIN_MODIFIER_AMOUNT, MAX_MODIFIER_AMOUNT))
+                  for _ in range(rng.randint(MIN_MODIFIERS, MAX_MODIFIERS))])
+            for _ in range(n)]
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    # Seeding allocates millions of objects and frees none of them, so the collector would only be walking an ever
+    # bigger heap for nothing.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+
+    finally:
+        if enabled:
+            gc.enable()
@@ -1,18 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+from pydenim.events import EventLog
+from pydenim.genetics.lineage import LineageStore
+from pydenim.genetics.pool import GenePool
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar('T')
+Key = Tuple[Union[int, str], ...]
+
+
+class IdCheckpoint(NamedTuple):
+    count: int
+    stop: Optional[int]
+
+
 class IdGenerator:
+    # Hands out IDs from start up to (but not including) stop, if there is one. Workers and tiles should each be given
+    # their own block with reserve, so that they never have to share a counter (or a lock) with anyone else.
 
-    def __init__(self):
-        self.count = 10
+    def __init__(self, start: int = 11, stop: Optional[int] = None):
+        self.count = start - 1
+        self.stop = stop
+        self._lock = threading.Lock()
 
     def __call__(self) -> int:
-        self.count += 1
-        return self.count
+        return self.allocate(1).start
+
+    def __getstate__(self) -> IdCheckpoint:
+        return self.checkpoint()
+
+    def __setstate__(self, checkpoint: IdCheckpoint):
+        self._lock = threading.Lock()
+        self.restore(checkpoint)
+
+    def allocate(self, n: int) -> range:
+        with self._lock:
+            start = self.count + 1
+            if self.stop is not None and start + n > self.stop:
+                raise ValueError(f'Could not allocate {n} IDs from a block with {self.stop - start} left.')
+
+            self.count += n
+
+        return range(start, start + n)
+
+    def reserve(self, n: int) -> IdGenerator:
+        block = self.allocate(n)
+        return IdGenerator(block.start, block.stop)
+
+    def checkpoint(self) -> IdCheckpoint:
+        with self._lock:
+            return IdCheckpoint(self.count, self.stop)
+
+    def restore(self, checkpoint: IdCheckpoint):
+        with self._lock:
+            self.count, self.stop = checkpoint
+
+
+class Rng:
+    # Every stream is named by a key, and seeded from a hash of (seed, key) rather than from its parent's state, so a
+    # stream draws the same numbers no matter how many others were split off or drawn from before it. Key streams by
+    # whatever partitions the work (epoch, tile, actor ID...) and a seeded run will come out the same however it's
+    # spread over workers.
+
+    def __init__(self, seed: Optional[int] = None, key: Key = ()):
+        self.reseed(seed, key)
+
+    def reseed(self, seed: Optional[int] = None, key: Key = ()):
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.key = key
+        self._random = random.Random(self._derive(key))
+
+    def split(self, *key: Union[int, str]) -> Rng:
+        return Rng(self.seed, self.key + key)
+
+    @contextmanager
+    def substream(self, *key: Union[int, str]) -> Iterator[Rng]:
+        # For code that draws from the shared service instead of taking an Rng.
+        saved = self.key, self._random
+        self.key = self.key + key
+        self._random = random.Random(self._derive(self.key))
+        try:
+            yield self
+
+        finally:
+            self.key, self._random = saved
+
+    def random(self) -> float:
+        return self._random.random()
+
+    def randoms(self, n: int) -> List[float]:
+        draw = self._random.random
+        return [draw() for _ in range(n)]
+
+    def randint(self, low: int, high: int) -> int:
+        return self._random.randint(low, high)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return self._random.choice(seq)
+
+    def choices(self, population: Sequence[T], k: int) -> List[T]:
+        return self._random.choices(population, k=k)
+
+    def sample(self, population: Sequence[T], k: int) -> List[T]:
+        return self._random.sample(population, k)
+
+    def getrandbits(self, k: int) -> int:
+        return self._random.getrandbits(k)
 
+    def numpy(self) -> np.random.Generator:
+        # Philox is counter-based too, so this is as reproducible as the draw that keys it.
+        import numpy as np
 
-class EventLogger:
+        return np.random.Generator(np.random.Philox(key=self.getrandbits(128)))
 
-    def __call__(self, event_code: str):
-        print(event_code)
+    def _derive(self, key: Key) -> int:
+        digest = hashlib.blake2b(repr((self.seed, *key)).encode(), digest_size=16).digest()
+        return int.from_bytes(digest, 'little')
 
 
 id_generator = IdGenerator()
-event_logger = EventLogger()
+event_log = EventLog()
+rng = Rng()
+lineage = LineageStore()
+gene_pool = GenePool()
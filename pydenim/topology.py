@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from pydenim.config import Config
+from pydenim.misc.data_structures import Direction
+from pydenim.misc.internal_types import Neighbourhood
+from pydenim.services import rng
+
+VON_NEUMANN: Tuple[Direction, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+MOORE: Tuple[Direction, ...] = VON_NEUMANN + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+_DIRECTIONS = {Neighbourhood.VonNeumann: VON_NEUMANN, Neighbourhood.Moore: MOORE}
+
+
+class Topology:
+    # Who neighbours whom, worked out once per world shape. Every step is at most one cell along each axis, so where a
+    # coordinate ends up after a step can be looked up in a table with one entry either side of the grid: for bounded
+    # worlds that's just the coordinate (the walls around the edge stop anyone from going further), and for wrapped
+    # ones it's the other side of the world. Either way, finding a neighbour costs the same.
+
+    def __init__(self, n_rows: int, n_cols: int, neighbourhood: Neighbourhood = Neighbourhood.VonNeumann,
+                 wrap: bool = False):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.directions = _DIRECTIONS[neighbourhood]
+        self.wrap = wrap
+        # How far in from the edge of the grid things can be put.
+        self.margin = 0 if wrap else 1
+        self._xs = self._steps(n_cols, wrap)
+        self._ys = self._steps(n_rows, wrap)
+
+    @classmethod
+    def of(cls, config: Config) -> Topology:
+        return _topology(config.n_rows, config.n_cols, config.neighbourhood, config.wrap)
+
+    def draw(self, n: int) -> List[Direction]:
+        # Everyone's direction for the epoch, in one go.
+        return rng.choices(self.directions, k=n)
+
+    def neighbours(self, xs: Sequence[int], ys: Sequence[int], directions: Sequence[Direction]) \
+            -> Tuple[List[int], List[int]]:
+        steps_x, steps_y = self._xs, self._ys
+        return ([steps_x[x + dx + 1] for x, (dx, _) in zip(xs, directions)],
+                [steps_y[y + dy + 1] for y, (_, dy) in zip(ys, directions)])
+
+    @staticmethod
+    def _steps(size: int, wrap: bool) -> List[int]:
+        return [size - 1, *range(size), 0] if wrap else list(range(-1, size + 1))
+
+
+@lru_cache(maxsize=None)
+def _topology(n_rows: int, n_cols: int, neighbourhood: Neighbourhood, wrap: bool) -> Topology:
+    return Topology(n_rows, n_cols, neighbourhood, wrap)
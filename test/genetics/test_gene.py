@@ -1,6 +1,10 @@
+import pickle
+
+import pydenim.genetics.gene as gene_module
 from pydenim.genetics.gene import Genome, Gene, Modifier
 from pydenim.misc.internal_types import Statistic
 from pydenim.objects.organism import Statistics
+from pydenim.services import rng
 
 
 def test_genome():
@@ -15,3 +19,57 @@ def test_genome():
         ])
     ])
     assert genome.generate_statistics() == Statistics(strength=3, agility=1, constitution=2, health=100)
+
+
+def test_gene_vector():
+    gene = Gene([
+        Modifier(Statistic.Constitution, 2),
+        Modifier(Statistic.Strength, 3),
+        Modifier(Statistic.Constitution, -1)
+    ])
+    assert gene.vector == (3, 0, 1)
+
+
+def test_genome_missing_statistics():
+    genome = Genome([Gene([Modifier(Statistic.Agility, 2)])])
+    assert genome.generate_statistics() == Statistics(strength=0, agility=2, constitution=0, health=100)
+    assert genome.generate_statistics() is genome.generate_statistics()
+
+
+def make_genome(*amounts):
+    return Genome([Gene([Modifier(Statistic.Strength, amount)]) for amount in amounts])
+
+
+def test_breed():
+    left, right = make_genome(1, 2, 3, 4), make_genome(5, 6, 7, 8)
+    children = Genome.breed([(left, right), (right, left), (left, left)])
+    assert len(children) == 3
+    for child in children[:2]:
+        assert all(gene is left_gene or gene is right_gene
+                   for gene, left_gene, right_gene in zip(child.genes, left.genes, right.genes))
+
+    assert children[2].genes == left.genes
+
+
+def test_breed_reproducible():
+    parents = [(make_genome(*range(50)), make_genome(*range(50, 100)))] * 10
+    rng.reseed(1)
+    first = Genome.breed(parents)
+    rng.reseed(1)
+    assert Genome.breed(parents) == first
+    assert len({tuple(gene.vector for gene in child.genes) for child in first}) > 1
+
+
+def test_breed_mutates(monkeypatch):
+    mutant = Gene([])
+    monkeypatch.setattr(gene_module, 'MUTATION_CHANCE', 1)
+    monkeypatch.setattr(Gene, 'mutated', lambda self: mutant)
+    assert make_genome(1, 2) ^ make_genome(3, 4) == Genome([mutant, mutant])
+
+
+def test_pickle_keeps_genes_pooled():
+    genome = Genome([Gene([Modifier(Statistic.Strength, 7)]), Gene([Modifier(Statistic.Agility, 7)])])
+    pooled = genome.genes
+    copied = pickle.loads(pickle.dumps(genome))
+    assert copied == genome
+    assert all(gene is pooled_gene for gene, pooled_gene in zip(copied.genes, pooled))
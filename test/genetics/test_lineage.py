@@ -0,0 +1,69 @@
+import pytest
+
+from pydenim.genetics.lineage import NO_PARENT, Lineage, LineageStore
+from pydenim.misc.internal_types import Gender
+
+
+def make_store(**kwargs):
+    store = LineageStore(**kwargs)
+    store.record(1, None, None, Gender.Male)
+    store.record(2, None, None, Gender.Female)
+    store.advance(1)
+    store.record(3, 1, 2, Gender.Female)
+    store.record(4, None, None, Gender.Male)
+    store.advance(2)
+    store.record(5, 4, 3, Gender.Male)
+    return store
+
+
+def test_lookup():
+    store = make_store()
+    assert store[3] == Lineage(3, 1, 2, Gender.Female, 1)
+    assert store[1] == Lineage(1, NO_PARENT, NO_PARENT, Gender.Male, 0)
+    with pytest.raises(KeyError):
+        store[6]
+
+
+def test_ancestors():
+    store = make_store()
+    assert store.parents(5) == (store[4], store[3])
+    assert [lineage.id for lineage in store.ancestors(5)] == [4, 3, 1, 2]
+    assert [lineage.id for lineage in store.ancestors(5, generations=1)] == [4, 3]
+
+
+def test_retention():
+    store = make_store(retention=1)
+    assert len(store) == 3
+    assert 1 not in store
+    assert [lineage.id for lineage in store.ancestors(5)] == [4, 3]
+
+
+def test_spill(tmp_path):
+    store = make_store(retention=1, spill_path=str(tmp_path / 'lineage.bin'))
+    assert len(store) == 3
+    assert store[1] == Lineage(1, NO_PARENT, NO_PARENT, Gender.Male, 0)
+    assert [lineage.id for lineage in store.ancestors(5)] == [4, 3, 1, 2]
+
+
+def test_retention_after_rewind():
+    # An old board stepped after a newer one records births out of order, which mustn't evict anything too new.
+    store = LineageStore(retention=5)
+    store.advance(9)
+    store.record(1, None, None, Gender.Male)
+    store.advance(2)
+    store.record(2, None, None, Gender.Female)
+    store.record(3, None, None, Gender.Male)
+    store.advance(10)
+    assert 1 in store
+    store.advance(15)
+    assert len(store) == 0
+
+
+def test_spill_index(tmp_path):
+    store = make_store(retention=0, spill_path=str(tmp_path / 'lineage.bin'))
+    store.advance(3)
+    assert len(store) == 0
+    assert [lineage.id for lineage in store.ancestors(5)] == [4, 3, 1, 2]
+    assert store[5] == Lineage(5, 4, 3, Gender.Male, 2)
+    with pytest.raises(KeyError):
+        store[6]
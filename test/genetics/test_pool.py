@@ -0,0 +1,30 @@
+import gc
+
+from pydenim.genetics.gene import Gene, Genome, Modifier
+from pydenim.genetics.pool import GenePool
+from pydenim.misc.internal_types import Statistic
+
+
+def test_intern():
+    pool = GenePool()
+    first = pool.intern(Gene([Modifier(Statistic.Strength, 1)]))
+    assert pool.intern(Gene([Modifier(Statistic.Strength, 1)])) is first
+    second = pool.intern(Gene([Modifier(Statistic.Strength, 2)]))
+    assert second is not first
+    assert pool.statistics() == (3, 1, 2)
+    assert pool.statistics().dedup_ratio == 1.5
+
+
+def test_evicts_unreferenced():
+    pool = GenePool()
+    gene = pool.intern(Gene([Modifier(Statistic.Agility, 1)]))
+    assert len(pool) == 1
+    del gene
+    gc.collect()
+    assert len(pool) == 0
+
+
+def test_genomes_share_genes():
+    first = Genome([Gene([Modifier(Statistic.Constitution, 4)])])
+    second = Genome([Gene([Modifier(Statistic.Constitution, 4)])])
+    assert first.genes[0] is second.genes[0]
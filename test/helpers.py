@@ -0,0 +1,26 @@
+from pydenim.genetics.gene import Gene, Genome, Modifier
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.misc.internal_types import Gender, Statistic
+from pydenim.objects.base import BoardActor
+from pydenim.objects.neutral import OBSTACLE, WALL
+from pydenim.objects.organism import Bio
+
+GENOME = Genome([
+    Gene([
+        Modifier(Statistic.Strength, 1),
+        Modifier(Statistic.Agility, 1),
+        Modifier(Statistic.Constitution, 1)
+    ])
+])
+BIO = Bio(None, None, Gender.Female)
+
+
+def make_actors(centre: BoardActor, edges: BoardActor = OBSTACLE) -> Sliceable2DList[BoardActor]:
+    # A 5x5 walled grid with centre in the middle, surrounded by edges orthogonally and obstacles diagonally.
+    return Sliceable2DList([
+        [WALL, WALL, WALL, WALL, WALL],
+        [WALL, OBSTACLE, edges, OBSTACLE, WALL],
+        [WALL, edges, centre, edges, WALL],
+        [WALL, OBSTACLE, edges, OBSTACLE, WALL],
+        [WALL, WALL, WALL, WALL, WALL],
+    ])
@@ -1,6 +1,6 @@
 import pytest
 
-from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.misc.data_structures import ChunkedGrid, PriorityIndex, Sliceable2DList, SliceableNDList, TimerWheel
 
 
 @pytest.mark.parametrize(['data', 'coordinates', 'value', 'expected'], [
@@ -173,3 +173,218 @@ def test_getitem(data, coordinates, value):
 ])
 def test_eq(data, coordinates, value):
     assert Sliceable2DList(data)[coordinates] == value
+
+
+def test_map_coords():
+    assert Sliceable2DList([[1, 2], [3, 4]]).map_coords(lambda x, y, element: (x, y, element)) == [
+        [(0, 0, 1), (1, 0, 2)],
+        [(0, 1, 3), (1, 1, 4)]
+    ]
+
+
+def test_priority_index():
+    index = PriorityIndex(len)
+    index.put(0, 0, 'a')
+    index.put(1, 0, 'ccc')
+    index.put(2, 0, 'bb')
+    index.put(3, 0, 'dd')
+    index.put(0, 0, 'eeee')
+    index.discard(1, 0)
+    index.discard(1, 0)
+    assert list(index) == [(0, 0, 'eeee'), (2, 0, 'bb'), (3, 0, 'dd')]
+    assert (1, 0) not in index
+    assert len(index) == 3
+
+
+def test_priority_index_copy():
+    index = PriorityIndex(len)
+    for y in range(40):
+        index.put(0, y, 'a' * (y % 3 + 1))
+
+    copy = index.copy()
+    copy.put(1, 0, 'bbbb')
+    copy.discard(0, 39)
+    index.put(2, 5, 'cccc')
+    assert (len(index), len(copy)) == (41, 40)
+    assert (1, 0) in copy and (1, 0) not in index
+    assert (0, 39) in index and (0, 39) not in copy
+    assert list(copy)[0] == (1, 0, 'bbbb')
+    assert list(index)[0] == (2, 5, 'cccc')
+    # Nothing was written near the middle, so that shard is still shared.
+    assert copy._shards[1] is index._shards[1]
+
+
+def test_map_shares_unchanged_rows():
+    data = Sliceable2DList([[1, 2], [3, 4]])
+    mapped = data.map(lambda element: element if element < 3 else element * 10)
+    assert mapped._data[0] is data._data[0]
+    assert mapped._data[1] is not data._data[1]
+
+    mapped[0, 0] = 0
+    data[0, 1] = 0
+    assert data == [[1, 2], [0, 4]]
+    assert mapped == [[0, 2], [30, 40]]
+
+
+def test_snapshot():
+    data = Sliceable2DList([[1, 2], [3, 4]])
+    snapshot = data.snapshot()
+    data.inner.fill(0)
+    data[0, 0] = 0
+    snapshot[1, 1] = 5
+    assert data == [[0, 2], [3, 4]]
+    assert snapshot == [[1, 2], [3, 5]]
+
+
+def test_timer_wheel():
+    wheel = TimerWheel()
+    wheel.schedule(3, 'a')
+    wheel.schedule(1, 'b')
+    copy = wheel.copy()
+    copy.schedule(3, 'c')
+    wheel.schedule(3, 'd')
+    assert list(wheel) == [(1, 'b'), (3, 'a'), (3, 'd')]
+    assert list(copy) == [(1, 'b'), (3, 'a'), (3, 'c')]
+    assert copy.pop(3) == ['a', 'c']
+    assert copy.pop(3) == []
+    assert len(copy) == 1
+    assert len(wheel) == 3
+
+
+def test_chunked_grid():
+    grid = ChunkedGrid(5, 6, 0, edge_value=9, chunk_size=2)
+    assert grid == [[9] * 6] + [[9, 0, 0, 0, 0, 9] for _ in range(3)] + [[9] * 6]
+    assert grid.chunk_count == 0
+
+    grid[1, 1] = 1
+    grid.inner[2, 1] = 2
+    assert grid[1:4, 1:3] == [[1, 0, 0], [0, 0, 2]]
+    assert grid.chunk_count == 2
+    assert sorted(grid.iter_occupied()) == [(1, 1, 1), (3, 2, 2)]
+
+    grid[1, 1] = 0
+    assert grid.chunk_count == 1
+
+    with pytest.raises(IndexError):
+        grid[6, 0] = 1
+
+
+def test_chunked_grid_snapshot():
+    grid = ChunkedGrid(4, 4, 0, chunk_size=2)
+    grid[1, 1] = 1
+    snapshot = grid.snapshot()
+    grid[1, 1] = 0
+    snapshot[2, 2] = 2
+    assert grid == [[0] * 4 for _ in range(4)]
+    assert snapshot == [[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 2, 0], [0, 0, 0, 0]]
+    assert grid.chunk_count == 0
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 4, 8])
+def test_chunked_grid_matches_dense(chunk_size):
+    dense = Sliceable2DList.uniform(7, 5, 0)
+    chunked = ChunkedGrid(7, 5, 0, chunk_size=chunk_size)
+    for grid in [dense, chunked]:
+        grid[:, 2] = range(5)
+        grid[3, :] = [1] * 7
+        grid.inner[:2, :2] = [[5, 6], [7, 8]]
+        grid.replace(1, 2)
+
+    assert chunked == dense.values
+    assert chunked.map(str) == dense.map(str)
+    assert list(chunked) == list(dense)
+
+
+def test_nd_list_views():
+    cube = SliceableNDList([[[0, 1, 2], [3, 4, 5]], [[6, 7, 8], [9, 10, 11]]])
+    assert cube.shape == (2, 2, 3)
+    assert cube[1, 0, 2] == 8
+    assert cube[1] == [[6, 7, 8], [9, 10, 11]]
+    assert cube[:, 1, ::-2] == [[5, 3], [11, 9]]
+    assert cube[0].T == [[0, 3], [1, 4], [2, 5]]
+    assert cube.transpose(2, 0, 1)[1] == [[1, 4], [7, 10]]
+    assert cube[:, :, 1:][1][::-1, 0] == [10, 7]
+
+    cube[1].T[2] = [-1, -2]
+    cube[0, :, ::2].fill(0)
+    assert cube == [[[0, 1, 0], [0, 4, 0]], [[6, 7, -1], [9, 10, -2]]]
+
+
+@pytest.mark.parametrize('index, value', [
+    ((0, slice(None)), [1, 2]),
+    ((slice(None), 0), [1, 2, 3]),
+    ((slice(None), slice(1, None)), [[1, 2, 3], [4, 5, 6]]),
+])
+def test_nd_list_set_shape_mismatch(index, value):
+    with pytest.raises(ValueError):
+        SliceableNDList.uniform((2, 3), 0)[index] = value
+
+
+def test_nd_list_inner():
+    grid = SliceableNDList.uniform((5, 5), 0)
+    grid.inner.inner[0, 0] = 1
+    assert grid[2, 2] == 1
+    assert grid.inner.map(str) == [['0', '0', '0'], ['0', '1', '0'], ['0', '0', '0']]
+
+
+def test_nd_list_array():
+    np = pytest.importorskip('numpy')
+    history = SliceableNDList.uniform((3, 4, 5), 0, typecode='l')
+    world = np.asarray(history[1, ::-1, 1:])
+    world[0, 0] = 7
+    assert history[1, 3, 1] == 7
+    assert np.shares_memory(world, np.asarray(history))
+    assert np.asarray(SliceableNDList([['a', 'b']])).tolist() == [['a', 'b']]
+
+    copied = np.array(history, copy=True)
+    copied[0, 0, 0] = 9
+    assert history[0, 0, 0] == 0
+    with pytest.raises(ValueError):
+        np.array(SliceableNDList([['a', 'b']]), copy=False)
+
+
+@pytest.mark.parametrize('view, shape, values', [
+    (SliceableNDList([[1, 2]])[:, 5:], (1, 0), [[]]),
+    (SliceableNDList([[]]), (1, 0), [[]]),
+    (SliceableNDList([[1, 2], [3, 4]])[2:], (0, 2), []),
+    (SliceableNDList.uniform((2, 1, 3), 0)[:, :, 3:], (2, 1, 0), [[[]], [[]]]),
+])
+def test_nd_list_empty(view, shape, values):
+    assert view.shape == shape
+    assert view.size == 0
+    assert view == values
+    assert str(view) == str(values)
+
+
+def test_nd_list_buffer():
+    history = SliceableNDList.uniform((3, 4, 5), 0, typecode='d')
+    buffer = history[2].__buffer__(0)
+    assert buffer.shape == (4, 5)
+    buffer[1, 2] = 1.5
+    assert history[2, 1, 2] == 1.5
+    with pytest.raises(BufferError):
+        history[:, 1].__buffer__(0)
+
+
+@pytest.mark.parametrize('grid', [
+    Sliceable2DList([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]),
+    ChunkedGrid(3, 4, 0, chunk_size=2),
+])
+def test_take_put(grid):
+    grid[:, :] = [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+    assert grid.take([0, 3, 1], [0, 1, 2]) == [0, 7, 9]
+    assert grid.inner.take([0, 1], [0, 0]) == [5, 6]
+    assert grid.inner.neighbours([0, 1], [0, 0], [(0, -1), (1, 1)]) == [1, 11]
+
+    grid.inner.put([1, 0], [0, 0], [-6, -5])
+    assert grid.values[1] == [4, -5, -6, 7]
+    with pytest.raises(ValueError):
+        grid.put([0, 1], [0], [1, 2])
+
+
+def test_put_copies_shared_rows():
+    data = Sliceable2DList([[1, 2], [3, 4]])
+    snapshot = data.snapshot()
+    data.put([1], [1], [5])
+    assert data == [[1, 2], [3, 5]]
+    assert snapshot == [[1, 2], [3, 4]]
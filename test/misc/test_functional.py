@@ -1,6 +1,6 @@
 import pytest
 
-from pydenim.misc.functional import orc
+from pydenim.misc.functional import bernoulli_indices, orc, update
 
 
 @pytest.mark.parametrize(['left', 'right', 'expected'], [
@@ -12,3 +12,28 @@ from pydenim.misc.functional import orc
 ])
 def test_orc(left, right, expected):
     assert orc(left, right) == expected
+
+
+@pytest.mark.parametrize(['current', 'change', 'expected'], [
+    (1, None, 1),
+    (1, 0, 0),
+    (0, 2, 2),
+    (1, lambda x: x + 1, 2)
+])
+def test_update(current, change, expected):
+    assert update(current, change) == expected
+
+
+@pytest.mark.parametrize(['n', 'p', 'expected'], [
+    (5, 0, []),
+    (5, 1, [0, 1, 2, 3, 4]),
+    (0, 0.5, [])
+])
+def test_bernoulli_indices(n, p, expected):
+    assert list(bernoulli_indices(n, p)) == expected
+
+
+def test_bernoulli_indices_rate():
+    indices = list(bernoulli_indices(100000, 0.2))
+    assert indices == sorted(set(indices))
+    assert 19000 < len(indices) < 21000
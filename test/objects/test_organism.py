@@ -0,0 +1,51 @@
+import pytest
+
+from pydenim.genetics.gene import Genome
+from pydenim.misc.internal_types import Gender
+from pydenim.objects.neutral import SPACE, WALL, Egg, Food
+from pydenim.objects.organism import Organism, Statistics
+from test.helpers import BIO, GENOME
+
+
+@pytest.mark.parametrize('actor', [
+    Organism.new(GENOME, BIO),
+    Food(100, 5, 5),
+    Egg(100, GENOME, BIO, 5),
+    SPACE,
+    WALL
+])
+def test_compact(actor):
+    assert not hasattr(actor, '__dict__')
+
+
+def test_statistics_modify():
+    statistics = Statistics(strength=1, agility=2, constitution=3, health=100)
+    assert statistics.modify(agility=5, health=lambda health: health - 10) == Statistics(1, 5, 3, 90)
+
+
+def test_laying_clears_pregnancy():
+    egg = Egg(100, GENOME, BIO, 5)
+    pregnant = Organism.new(GENOME, BIO).modify(pregnant_with=egg)
+    assert pregnant.modify(bio=BIO).pregnant_with is egg
+    mother, laid = pregnant.interact(SPACE)
+    assert laid is egg
+    assert mother.pregnant_with is None
+    assert not any(isinstance(actor, Egg) for actor in mother.interact(SPACE))
+
+
+def test_mating_conceives(monkeypatch):
+    bred = []
+    breed = Genome.breed
+    monkeypatch.setattr(Genome, 'breed', classmethod(lambda cls, parents: bred.append(parents) or breed(parents)))
+    female = Organism.new(GENOME, BIO)
+    male = Organism.new(GENOME, BIO._replace(gender=Gender.Male))
+    mother, father = female._mate(male)
+    egg = mother.pregnant_with
+    assert father is male
+    assert egg.child_bio[:2] == (male.id, female.id)
+    assert egg.parent_genomes == (GENOME, GENOME)
+    assert not bred
+    # Nobody bred it in a batch, so looking at it breeds it.
+    assert egg.child_genome == GENOME
+    assert bred == [[(GENOME, GENOME)]]
+    assert egg.parent_genomes is None
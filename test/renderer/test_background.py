@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.renderer.background import BackgroundRenderer, FrameMetrics
+from pydenim.renderer.base import Renderer
+
+CONFIG = Config(n_rows=10, n_cols=10, starting_organism_count=5, seed=0)
+
+
+class RecordingRenderer(Renderer):
+    # Blocks on every board until released, like a terminal that can't keep up.
+
+    def __init__(self):
+        self.drawn = []
+        self.released = threading.Event()
+
+    def render_board(self, board):
+        self.released.wait()
+        self.drawn.append(board.epoch)
+
+    def render_actor(self, actor):
+        self.drawn.append(actor)
+
+    def convert_actor(self, actor):
+        return actor
+
+    def render_text(self, text):
+        self.drawn.append(text)
+
+
+class BrokenRenderer(RecordingRenderer):
+
+    def render_board(self, board):
+        raise OSError('Broken pipe')
+
+
+def wait_until_busy(renderer):
+    while not renderer._busy:
+        pass
+
+
+def test_latest_frame_wins():
+    recording = RecordingRenderer()
+    board = Board.initialise(CONFIG)
+    with BackgroundRenderer(recording, snapshot=False, lag_threshold=60) as renderer:
+        renderer.render_board(board)
+        wait_until_busy(renderer)
+        for _ in range(10):
+            board = board.age()
+            renderer.render_board(board)
+
+        renderer.render_text('done')
+        recording.released.set()
+        assert renderer.wait(5)
+
+    # Everything but the last board was replaced while the worker was stuck on the first.
+    assert recording.drawn == [0, 'done', 10]
+    assert renderer.metrics() == FrameMetrics(11, 2, 9, 0, renderer.max_lag)
+
+
+def test_busy_frames_are_not_snapshotted(monkeypatch):
+    recording = RecordingRenderer()
+    board = Board.initialise(CONFIG)
+    snapshots = []
+    snapshot = board.snapshot
+    monkeypatch.setattr(board, 'snapshot', lambda: snapshots.append(board.epoch) or snapshot())
+    with BackgroundRenderer(recording) as renderer:
+        renderer.render_board(board)
+        wait_until_busy(renderer)
+        for _ in range(10):
+            board.step_in_place()
+            renderer.render_board(board)
+
+        recording.released.set()
+        renderer.wait(5)
+        renderer.render_board(board)
+
+    assert snapshots == [0, 10]
+    assert recording.drawn == [0, 10]
+    assert renderer.metrics().dropped == 10
+
+
+def test_lag():
+    ticks = iter(range(100))
+    renderer = BackgroundRenderer(RecordingRenderer(), lag_threshold=0.5, clock=lambda: next(ticks))
+    renderer.renderer.released.set()
+    renderer.render_board(Board.initialise(CONFIG))
+    renderer.close()
+    assert renderer.metrics() == FrameMetrics(1, 1, 0, 1, 1)
+
+
+def test_renderer_errors_are_raised():
+    renderer = BackgroundRenderer(BrokenRenderer())
+    renderer.render_board(Board.initialise(CONFIG))
+    with pytest.raises(OSError):
+        renderer.wait(5)
+
+    with pytest.raises(OSError):
+        renderer.render_text('anyone there?')
+
+    with pytest.raises(OSError):
+        renderer.close()
@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Food
+from pydenim.renderer.console import CLEAR, IncrementalConsoleRenderer, Viewport
+
+CONFIG = Config(n_rows=4, n_cols=5, starting_organism_count=0)
+
+
+def make_board(*inner):
+    return Board(CONFIG, Sliceable2DList([
+        [WALL] * 5,
+        [WALL, *inner[:3], WALL],
+        [WALL, *inner[3:], WALL],
+        [WALL] * 5,
+    ]))
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_draws_only_changes():
+    stream = io.StringIO()
+    renderer = IncrementalConsoleRenderer(stream, fps=None)
+    renderer.render_board(make_board(SPACE, SPACE, SPACE, SPACE, OBSTACLE, SPACE))
+    assert stream.getvalue() == f'{CLEAR}\x1b[1;1H█████\x1b[2;1H█   █\x1b[3;1H█ █ █\x1b[4;1H█████\x1b[5;1H'
+
+    stream.seek(0)
+    stream.truncate()
+    renderer.render_board(make_board(SPACE, SPACE, Food(100, 5, 5), SPACE, OBSTACLE, SPACE))
+    assert stream.getvalue() == '\x1b[2;4H*\x1b[5;1H'
+
+    stream.seek(0)
+    stream.truncate()
+    renderer.render_board(make_board(SPACE, SPACE, Food(100, 5, 5), SPACE, OBSTACLE, SPACE))
+    assert stream.getvalue() == ''
+
+
+def test_frame_rate():
+    clock = Clock()
+    renderer = IncrementalConsoleRenderer(io.StringIO(), fps=10, clock=clock)
+    board = make_board(*[SPACE] * 6)
+    assert renderer.render_board(board)
+    clock.now = 0.05
+    assert not renderer.render_board(board)
+    assert renderer.render_board(board, force=True)
+    clock.now = 0.2
+    assert renderer.render_board(board)
+    assert (renderer.drawn, renderer.skipped) == (3, 1)
+
+
+@pytest.mark.parametrize('viewport, expected', [
+    (Viewport(1, 1, 2, 1), f'{CLEAR}\x1b[1;2H*\x1b[2;1H'),
+    (Viewport(3, 2, 10, 10), f'{CLEAR}\x1b[1;1H██\x1b[2;1H██\x1b[3;1H'),
+])
+def test_viewport(viewport, expected):
+    stream = io.StringIO()
+    renderer = IncrementalConsoleRenderer(stream, fps=None, viewport=viewport)
+    renderer.render_board(make_board(SPACE, Food(100, 5, 5), SPACE, SPACE, SPACE, OBSTACLE))
+    assert stream.getvalue() == expected
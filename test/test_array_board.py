@@ -0,0 +1,153 @@
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import pydenim.array_board
+from pydenim.array_board import ArrayBoard
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.misc.constants import EGG_LIFESPAN, OBSTACLE_ID, WALL_ID
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.misc.internal_types import Engine
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Egg, Food
+from pydenim.objects.organism import Organism
+from pydenim.profiling import MetricsCollector, Profiler
+from test.helpers import BIO, GENOME, make_actors
+
+CONFIG = Config(n_rows=5, n_cols=5, starting_organism_count=0, engine=Engine.Array)
+
+
+def make_board(centre, edges=OBSTACLE):
+    return ArrayBoard.from_board(Board(CONFIG, make_actors(centre, edges)))
+
+
+def test_round_trip():
+    board = make_board(Food(100, 3, 5))
+    assert board.to_board().actors == board.actors
+    assert board[2, 2] == Food(100, 3, 5)
+    assert board[0, 0] is WALL
+
+
+@pytest.mark.parametrize('coordinates', [
+    (slice(1, 4), slice(2, 5)),
+    (slice(None), slice(-2, None)),
+    (2, slice(None)),
+    (slice(1, 3), -1),
+])
+def test_slice_decodes_only_region(monkeypatch, coordinates):
+    board = make_board(Food(100, 3, 5), SPACE)
+    expected = board.actors[coordinates]
+    decoded = []
+    decode = board._decode
+    monkeypatch.setattr(board, '_decode', lambda x, y: decoded.append((x, y)) or decode(x, y))
+    region = board[coordinates]
+    assert region == expected
+    cells = sum(map(len, region.values)) if isinstance(region, Sliceable2DList) else len(region)
+    assert len(decoded) == cells
+
+
+def test_food_spoils():
+    board = make_board(Food(100, 1, 5))
+    board = board.age()
+    assert board[2, 2].lifespan == 0
+    assert board.age()[2, 2] is SPACE
+
+
+def test_egg_hatches():
+    board = make_board(Egg(100, GENOME, BIO, EGG_LIFESPAN))
+    for _ in range(EGG_LIFESPAN + 1):
+        assert isinstance(board[2, 2], Egg)
+        board = board.age()
+
+    hatchling = board[2, 2]
+    assert isinstance(hatchling, Organism)
+    assert hatchling.genome is GENOME
+    assert set(board.objects) == {hatchling.id}
+
+
+def test_organism_eats():
+    organism = Organism.new(GENOME, BIO)
+    board = make_board(organism, Food(100, 5, 5)).age()
+    eaters = [actor for row in board for actor in row if isinstance(actor, Organism)]
+    food = [actor for row in board for actor in row if isinstance(actor, Food)]
+    assert board[2, 2] is SPACE
+    assert len(food) == 3
+    assert [eater.statistics.health for eater in eaters] == [organism.statistics.health + 5]
+
+
+def test_food_spawns_on_space(monkeypatch):
+    monkeypatch.setattr(pydenim.array_board, 'FOOD_CHANCE', 1)
+    board = make_board(SPACE, SPACE).age()
+    food = [board[x, y] for x, y in [(2, 1), (1, 2), (2, 2), (3, 2), (2, 3)]]
+    ids = sorted(actor.id for actor in food)
+    assert all(isinstance(actor, Food) for actor in food)
+    assert ids == list(range(ids[0], ids[0] + 5))
+
+
+def layout(board):
+    return [[actor.genome if isinstance(actor, Organism) else actor is WALL for actor in row] for row in board]
+
+
+def test_initialise_matches_object_engine():
+    config = Config(n_rows=12, n_cols=10, starting_organism_count=15, seed=3, obstacle_chance=0.1)
+    board = Board.initialise(config)
+    array_board = Board.initialise(replace(config, engine=Engine.Array))
+    assert isinstance(array_board, ArrayBoard)
+    # Obstacles are drawn differently by each engine, but everything else comes out the same.
+    assert layout(array_board) == layout(board)
+    assert any(actor is OBSTACLE for row in array_board for actor in row)
+
+
+def test_initialise_huge():
+    config = Config(n_rows=2000, n_cols=2000, starting_organism_count=100, seed=1, engine=Engine.Array)
+    board = Board.initialise(config)
+    obstacles = (board.kinds == OBSTACLE_ID).sum()
+    assert abs(obstacles / (1998 * 1998) - config.obstacle_chance) < 0.005
+    assert (board.kinds[0] == WALL_ID).all() and (board.kinds[:, -1] == WALL_ID).all()
+
+
+def test_from_aged_board():
+    board = Board(CONFIG, make_board(Food(100, 3, 5)).actors).age()
+    assert ArrayBoard.from_board(board)[2, 2].lifespan == 2
+
+
+def test_step_in_place():
+    egg = Egg(100, GENOME, BIO, EGG_LIFESPAN)
+    board = make_board(egg)
+    kinds = board.kinds
+    before = board.snapshot()
+    for _ in range(EGG_LIFESPAN + 1):
+        assert board.step_in_place() is board
+        assert board.kinds is kinds
+
+    assert board.epoch == EGG_LIFESPAN + 1
+    assert isinstance(board[2, 2], Organism)
+    assert before.epoch == 0
+    assert before[2, 2] == egg
+
+
+def test_active_and_timers_match_board():
+    organism = Organism.new(GENOME, BIO)
+    actors = make_actors(organism, SPACE)
+    actors[1, 2] = Food(100, 3, 5)
+    actors[2, 1] = Egg(101, GENOME, BIO, EGG_LIFESPAN)
+    board = Board(CONFIG, actors, epoch=4)
+    array_board = ArrayBoard.from_board(board)
+    assert array_board.active == list(board.active)
+    assert sorted(array_board.timers, key=lambda timer: timer[0]) == sorted(board.timers, key=lambda timer: timer[0])
+
+
+def test_profiler():
+    collector = MetricsCollector()
+    config = Config(n_rows=12, n_cols=12, starting_organism_count=40, seed=2, engine=Engine.Array)
+    board = Board.initialise(config)
+    board.profiler = Profiler(collector)
+    for _ in range(EGG_LIFESPAN + 5):
+        board = board.age()
+
+    assert [metrics.epoch for metrics in collector.epochs] == list(range(1, EGG_LIFESPAN + 6))
+    totals = collector.totals()
+    assert sum(totals.interactions.values()) > 0
+    assert totals.phases['interact'] > 0
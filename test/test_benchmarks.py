@@ -0,0 +1,24 @@
+import json
+
+from benchmarks.cases import cases
+from benchmarks.runner import compare, load, measure, save
+
+
+def test_benchmarks(tmp_path):
+    # Only checks that the smallest of each kind of case runs and round trips, not how fast anything is.
+    smallest = {}
+    for case in cases():
+        kind = case.name.split('[')[0]
+        if kind not in smallest or case.scale < smallest[kind].scale:
+            smallest[kind] = case
+
+    results = {case.name: measure(case, 1) for case in smallest.values()}
+    assert all(result.best > 0 and result.peak_bytes >= 0 for result in results.values())
+
+    path = tmp_path / 'baseline.json'
+    save(str(path), results)
+    assert set(json.loads(path.read_text())['results']) == set(results)
+    assert load(str(path)) == results
+    assert compare(results, results, 1.25) == []
+    assert compare(results, {name: result._replace(best=result.best * 2) for name, result in results.items()},
+                   1.25) == list(results)
@@ -0,0 +1,167 @@
+from dataclasses import replace
+
+import pydenim.board
+import pydenim.objects.organism
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.genetics.gene import Genome
+from pydenim.misc.constants import EGG_LIFESPAN
+from pydenim.misc.data_structures import ChunkedGrid, Sliceable2DList
+from pydenim.misc.internal_types import Engine, Gender, Neighbourhood
+from pydenim.objects.neutral import OBSTACLE, SPACE, WALL, Egg, Food
+from pydenim.objects.organism import Organism
+from pydenim.services import lineage
+from test.helpers import BIO, GENOME, make_actors
+
+CONFIG = Config(n_rows=5, n_cols=5, starting_organism_count=0)
+
+
+def make_board(centre):
+    return Board(CONFIG, make_actors(centre))
+
+
+def test_active_index_tracks_organisms():
+    organism = Organism.new(GENOME, BIO)
+    board = make_board(organism)
+    assert list(board.active) == [(2, 2, organism)]
+    assert list(board.age().active) == [(2, 2, organism)]
+
+
+def test_active_index_tracks_hatching():
+    board = make_board(Egg(100, GENOME, BIO, EGG_LIFESPAN))
+    for _ in range(EGG_LIFESPAN + 1):
+        assert not board.active
+        board = board.age()
+
+    assert list(board.active) == [(2, 2, board[2, 2])]
+
+
+def test_food_spawns_on_space(monkeypatch):
+    monkeypatch.setattr(pydenim.board, 'FOOD_CHANCE', 1)
+    board = make_board(SPACE).age()
+    food = board[2, 2]
+    assert isinstance(food, Food)
+    assert [actor for row in board for actor in row if isinstance(actor, Food)] == [food]
+
+
+def test_step_in_place():
+    egg = Egg(100, GENOME, BIO, EGG_LIFESPAN)
+    board = make_board(egg)
+    actors = board.actors
+    before = board.snapshot()
+    for _ in range(EGG_LIFESPAN + 1):
+        assert board.step_in_place() is board
+        assert board.actors is actors
+
+    assert board.epoch == EGG_LIFESPAN + 1
+    assert list(board.active) == [(2, 2, board[2, 2])]
+    assert isinstance(board[2, 2], Organism)
+    # Snapshots taken beforehand don't see any of it.
+    assert before.epoch == 0
+    assert before[2, 2] is egg
+    assert not before.active
+
+
+def test_history_shares_rows():
+    history = [make_board(Organism.new(GENOME, BIO))]
+    for _ in range(3):
+        history.append(history[-1].age())
+
+    assert [snapshot.epoch for snapshot in history] == [0, 1, 2, 3]
+    assert all(snapshot.actors._data[0] is history[0].actors._data[0] for snapshot in history)
+    assert all(snapshot.actors == history[0].actors for snapshot in history)
+
+
+def layout(board):
+    return [[(type(actor), getattr(actor, 'genome', None)) for actor in row] for row in board]
+
+
+def test_initialise():
+    config = Config(n_rows=12, n_cols=10, starting_organism_count=15, seed=3, obstacle_chance=0.1)
+    board = Board.initialise(config)
+    organisms = [actor for row in board for actor in row if isinstance(actor, Organism)]
+    assert len(organisms) == len(board.active) == 15
+    assert all(actor is WALL for actor in board.actors[0, :] + board.actors[-1, :])
+    assert all(board[x, y] is actor for x, y, actor in board.active)
+    assert layout(Board.initialise(config)) == layout(board)
+    assert layout(Board.initialise(Config(n_rows=12, n_cols=10, starting_organism_count=15, seed=4))) != layout(board)
+
+
+def test_unseeded_worlds_differ():
+    config = Config(n_rows=12, n_cols=12, starting_organism_count=10)
+    assert layout(Board.initialise(config)) != layout(Board.initialise(config))
+
+
+def test_founders_are_born_at_zero():
+    config = Config(n_rows=8, n_cols=8, starting_organism_count=4, seed=1)
+    board = Board.initialise(config)
+    for _ in range(3):
+        board = board.age()
+
+    founders = [actor for row in Board.initialise(config) for actor in row if isinstance(actor, Organism)]
+    assert all(lineage[organism.id].birth_epoch == 0 for organism in founders)
+
+
+def test_matings_are_bred_in_batches(monkeypatch):
+    monkeypatch.setattr(pydenim.objects.organism, 'IGNORE_CHANCE', 0)
+    monkeypatch.setattr(pydenim.objects.organism, 'MATE_CHANCE', 1)
+    bred = []
+    breed = Genome.breed
+    monkeypatch.setattr(Genome, 'breed', classmethod(lambda cls, parents: bred.append(parents) or breed(parents)))
+    # A checkerboard of genders, so that every organism has someone to mate with.
+    actors = [[WALL] * 8] + [[WALL] + [Organism.new(GENOME, BIO._replace(gender=Gender((x + y) % 2 + 1)))
+                                       for x in range(6)] + [WALL] for y in range(6)] + [[WALL] * 8]
+    board = Board(replace(CONFIG, n_rows=8, n_cols=8), Sliceable2DList(actors)).age()
+    eggs = [actor.pregnant_with for row in board for actor in row
+            if isinstance(actor, Organism) and actor.pregnant_with]
+    assert sum(map(len, bred)) == len(eggs)
+    assert len(bred) < len(eggs)
+    assert all(egg.parent_genomes is None for egg in eggs)
+
+
+def test_food_spoils():
+    food = Food(100, 1, 5)
+    board = make_board(food)
+    aged = board.age()
+    assert aged[2, 2] is food
+    assert aged.age()[2, 2] is SPACE
+    assert aged[2, 2] is board[2, 2] is food
+    assert not aged.age().timers
+
+
+def test_replaced_food_does_not_spoil():
+    board = make_board(Food(100, 1, 5))
+    board.actors[2, 2] = OBSTACLE
+    for _ in range(3):
+        board = board.age()
+
+    assert board[2, 2] is OBSTACLE
+
+
+def test_chunked_engine_matches_object_engine(monkeypatch):
+    monkeypatch.setattr(pydenim.board, 'FOOD_CHANCE', 0.01)
+    config = Config(n_rows=40, n_cols=30, starting_organism_count=30, seed=5, obstacle_chance=0.01)
+
+    def run(engine):
+        board = Board.initialise(replace(config, engine=engine))
+        history = [layout(board)]
+        for _ in range(5):
+            board = board.age()
+            history.append(layout(board))
+
+        return board, history
+
+    board, history = run(Engine.Chunked)
+    assert isinstance(board.actors, ChunkedGrid)
+    assert run(Engine.Object)[1] == history
+
+
+def test_wrapped_world():
+    config = Config(n_rows=6, n_cols=6, starting_organism_count=36, seed=1, neighbourhood=Neighbourhood.Moore,
+                    wrap=True)
+    board = Board.initialise(config)
+    assert all(isinstance(actor, Organism) for row in board for actor in row)
+    for _ in range(3):
+        board = board.age()
+
+    assert not any(actor is WALL for row in board for actor in row)
@@ -0,0 +1,123 @@
+import io
+import threading
+import time
+
+import pytest
+
+from pydenim.events import MAGIC, NO_ID, Event, EventLog, read_events
+from pydenim.misc.internal_types import EventKind, Overflow
+
+
+def emit_all(log, n):
+    for id in range(n):
+        log.emit(id // 10, EventKind.Move, id, NO_ID, id % 7, id % 5)
+
+
+def expected(ids):
+    return [Event(id // 10, EventKind.Move, id, NO_ID, id % 7, id % 5) for id in ids]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'events.bin')
+    with EventLog(capacity=64, batch_size=16).open(path) as log:
+        emit_all(log, 1000)
+        log.flush()
+        assert list(read_events(path)) == expected(range(1000))
+        log.emit(100, EventKind.Birth, 1000, 999, 1, 2)
+
+    assert list(read_events(path))[-1] == Event(100, EventKind.Birth, 1000, 999, 1, 2)
+    assert log.emitted == 1001
+    assert log.dropped == 0
+
+
+def test_flush_does_not_wait_for_interval(tmp_path):
+    path = str(tmp_path / 'events.bin')
+    with EventLog(batch_size=1000, interval=60).open(path) as log:
+        emit_all(log, 1)
+        started = time.monotonic()
+        log.flush()
+        assert time.monotonic() - started < 5
+        assert list(read_events(path)) == expected(range(1))
+
+
+def test_closed_log_discards():
+    log = EventLog()
+    emit_all(log, 10)
+    assert log.emitted == 0
+    file = io.BytesIO()
+    log.open(file)
+    log.close()
+    emit_all(log, 10)
+    assert file.getvalue() == MAGIC
+
+
+class StuckFile(io.BytesIO):
+    # Holds the writer up until released, so the buffer fills up.
+
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+
+    def write(self, data):
+        if data != MAGIC:
+            self.released.wait()
+
+        return super().write(data)
+
+
+@pytest.mark.parametrize('overflow, ids', [
+    (Overflow.DropNewest, range(8)),
+    (Overflow.DropOldest, range(92, 100)),
+])
+def test_overflow(overflow, ids):
+    file = StuckFile()
+    # The writer only ever wakes up to close, so nothing leaves the buffer until then.
+    log = EventLog(capacity=8, overflow=overflow, batch_size=1000, interval=60).open(file)
+    emit_all(log, 100)
+    assert log.dropped == 92
+    file.released.set()
+    log.close()
+    file.seek(0)
+    assert list(read_events(file)) == expected(ids)
+
+
+def test_block():
+    file = StuckFile()
+    log = EventLog(capacity=8, overflow=Overflow.Block, batch_size=4).open(file)
+    emitter = threading.Thread(target=emit_all, args=(log, 100))
+    emitter.start()
+    emitter.join(0.2)
+    assert emitter.is_alive()
+    file.released.set()
+    emitter.join()
+    log.close()
+    file.seek(0)
+    assert list(read_events(file)) == expected(range(100))
+    assert log.dropped == 0
+
+
+class FullDisk(io.BytesIO):
+
+    def write(self, data):
+        if data != MAGIC:
+            raise OSError('No space left on device')
+
+        return super().write(data)
+
+
+def test_writer_errors_are_raised():
+    log = EventLog(capacity=4, overflow=Overflow.Block, batch_size=2).open(FullDisk())
+    with pytest.raises(OSError):
+        # Blocks once the buffer fills up, until the writer fails.
+        emit_all(log, 100)
+
+    with pytest.raises(OSError):
+        log.flush()
+
+    with pytest.raises(OSError):
+        log.close()
+
+
+def test_not_an_event_log():
+    with pytest.raises(ValueError):
+        list(read_events(io.BytesIO(b'nope')))
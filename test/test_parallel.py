@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+import pydenim.parallel
+from pydenim.array_board import EGG_KIND, ORGANISM_KIND, ArrayBoard
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.misc.data_structures import Sliceable2DList
+from pydenim.misc.internal_types import Engine, Gender
+from pydenim.misc.constants import EGG_LIFESPAN
+from pydenim.objects.neutral import SPACE, WALL, Egg
+from pydenim.objects.organism import Bio, Organism
+from pydenim.parallel import TiledStepper
+from pydenim.services import lineage, rng
+from test.helpers import BIO, GENOME
+
+CONFIG = Config(n_rows=12, n_cols=12, starting_organism_count=0, engine=Engine.Array)
+
+
+def make_board():
+    actors = Sliceable2DList.uniform(12, 12, WALL)
+    actors.inner.fill(SPACE)
+    for i, (x, y) in enumerate([(2, 2), (3, 2), (5, 6), (6, 6), (9, 4), (4, 9)]):
+        actors[x, y] = Organism.new(GENOME, Bio(None, None, Gender(i % 2 + 1)))
+
+    return ArrayBoard.from_board(Board(CONFIG, actors))
+
+
+def run(n_workers):
+    rng.reseed(1)
+    with TiledStepper(make_board(), tile_shape=(5, 5), n_workers=n_workers) as stepper:
+        for _ in range(5):
+            board = stepper.step()
+
+    return board
+
+
+def test_tiles():
+    with TiledStepper(make_board(), tile_shape=(5, 5), n_workers=1) as stepper:
+        assert [tile[1:] for tile in stepper.tiles] == [
+            (0, 5, 0, 5), (0, 5, 5, 10), (0, 5, 10, 12),
+            (5, 10, 0, 5), (5, 10, 5, 10), (5, 10, 10, 12),
+            (10, 12, 0, 5), (10, 12, 5, 10), (10, 12, 10, 12)
+        ]
+
+
+def test_independent_of_worker_count():
+    serial, parallel = run(1), run(3)
+    assert serial.epoch == parallel.epoch == 5
+    assert (serial.kinds == parallel.kinds).all()
+    assert (serial.lifespans == parallel.lifespans).all()
+    assert sorted(organism.statistics.health for organism in serial.objects.values()
+                  if isinstance(organism, Organism)) == \
+           sorted(organism.statistics.health for organism in parallel.objects.values()
+                  if isinstance(organism, Organism))
+    assert set(serial.objects) == set(serial.ids[(serial.kinds == EGG_KIND) | (serial.kinds == ORGANISM_KIND)].tolist())
+
+
+def worker_objects(tiles):
+    # Runs on the workers. Anything the halo moved onto these tiles isn't here yet.
+    objects = pydenim.parallel._objects
+    return [{id: state(objects[id]) for id in pydenim.parallel._window_ids(tile) if id in objects} for tile in tiles]
+
+
+def state(actor):
+    if isinstance(actor, Organism):
+        return actor.genome, actor.statistics, actor.pregnant_with and actor.pregnant_with.id
+
+    return actor.child_genome, actor.child_bio
+
+
+def test_workers_stay_in_sync():
+    rng.reseed(2)
+    board = Board.initialise(Config(n_rows=20, n_cols=20, starting_organism_count=120, seed=2, engine=Engine.Array))
+    with TiledStepper(board, tile_shape=(5, 5), n_workers=2) as stepper:
+        for _ in range(EGG_LIFESPAN + 5):
+            board = stepper.step()
+            # Whatever the halo changed only reaches the workers with the next epoch.
+            n_objects = 0
+            for objects, updates in zip(stepper._map(worker_objects), stepper._updates):
+                objects.update({id: state(actor) for id, actor in updates.items()})
+                assert objects == {id: state(board.objects[id]) for id in objects}
+                n_objects += len(objects)
+
+            assert n_objects == len(board.objects)
+
+
+def test_births_are_recorded():
+    board = make_board()
+    board._put(7, 7, Egg(100, GENOME, BIO, 0))
+    with TiledStepper(board, tile_shape=(5, 5), n_workers=2) as stepper:
+        board = stepper.step()
+
+    hatchling = board[7, 7]
+    assert isinstance(hatchling, Organism)
+    assert lineage[hatchling.id].gender is BIO.gender
@@ -0,0 +1,63 @@
+import pytest
+
+from pydenim.board import Board
+from pydenim.config import Config
+from pydenim.misc.internal_types import Gender, Outcome
+from pydenim.objects.neutral import SPACE, WALL, Egg, Food
+from pydenim.objects.organism import Bio, Organism
+from pydenim.profiling import NO_PROFILER, PHASES, MetricsCollector, Profiler, classify
+from test.helpers import GENOME
+
+FEMALE = Organism.new(GENOME, Bio(None, None, Gender.Female))
+MALE = Organism.new(GENOME, Bio(None, None, Gender.Male))
+EGG = Egg(100, GENOME, Bio(MALE.id, FEMALE.id, Gender.Male), 5)
+PREGNANT = FEMALE.modify(pregnant_with=EGG)
+
+
+@pytest.mark.parametrize('before, after, expected', [
+    ((FEMALE, SPACE), (SPACE, FEMALE), Outcome.Move),
+    ((FEMALE, SPACE), (FEMALE, SPACE), Outcome.Ignore),
+    ((PREGNANT, SPACE), (FEMALE, EGG), Outcome.Lay),
+    ((FEMALE, Food(100, 5, 5)), (SPACE, FEMALE), Outcome.Eat),
+    ((FEMALE, WALL), (FEMALE, WALL), Outcome.Ignore),
+    ((FEMALE, MALE), (FEMALE, MALE), Outcome.Ignore),
+    ((FEMALE, MALE), (PREGNANT, MALE), Outcome.Mate),
+    ((FEMALE, MALE), (FEMALE, SPACE), Outcome.Fight),
+    ((PREGNANT, MALE), (SPACE, MALE), Outcome.Fight),
+])
+def test_classify(before, after, expected):
+    assert classify(*before, *after) is expected
+
+
+def test_profiler():
+    collector = MetricsCollector()
+    profiler = Profiler(collector)
+    profiler.start(3)
+    with profiler.phase('age'):
+        pass
+
+    profiler.interactions([FEMALE, MALE, PREGNANT, SPACE], [FEMALE, SPACE, FEMALE, EGG])
+    profiler.expired([(1, 1, SPACE), (2, 2, MALE)])
+    metrics = profiler.finish()
+    assert collector.epochs == [metrics]
+    assert metrics.epoch == 3
+    assert set(metrics.phases) == set(PHASES)
+    assert metrics.phases['age'] > 0
+    assert metrics.interactions == {Outcome.Fight: 1, Outcome.Lay: 1}
+    assert (metrics.births, metrics.deaths, metrics.allocations) == (1, 1, 0)
+
+
+def test_board_profiler():
+    collector = MetricsCollector()
+    board = Board.initialise(Config(n_rows=20, n_cols=15, starting_organism_count=10, seed=0))
+    assert board.profiler is NO_PROFILER
+    board.profiler = Profiler(collector)
+    for _ in range(20):
+        board = board.age()
+
+    assert [metrics.epoch for metrics in collector.epochs] == list(range(1, 21))
+    totals = collector.totals()
+    assert totals.epoch == 20
+    assert totals.duration > 0
+    assert sum(totals.interactions.values()) > 0
+    assert totals.allocations > 0
@@ -0,0 +1,27 @@
+from pydenim.scheduling import Interaction, schedule
+
+
+def test_schedule():
+    interactions = [
+        Interaction(1, 1, None, 2, 1),
+        Interaction(5, 5, None, 5, 6),
+        Interaction(3, 1, None, 2, 1),
+        Interaction(1, 2, None, 1, 1),
+        Interaction(3, 2, None, 3, 1),
+        Interaction(7, 7, None, 7, 8)
+    ]
+    assert schedule(interactions) == [
+        [interactions[0], interactions[1], interactions[5]],
+        [interactions[2], interactions[3]],
+        [interactions[4]]
+    ]
+
+
+def test_schedule_batches_are_disjoint():
+    interactions = [Interaction(x, y, None, x + dx, y) for x in range(5) for y in range(5) for dx in [-1, 1]]
+    batches = schedule(interactions)
+    for batch in batches:
+        cells = [cell for interaction in batch for cell in interaction.cells]
+        assert len(cells) == len(set(cells))
+
+    assert sorted(interaction for batch in batches for interaction in batch) == sorted(interactions)
@@ -0,0 +1,33 @@
+import pytest
+
+from pydenim.config import Config
+from pydenim.misc.internal_types import Gender
+from pydenim.seeding import found, seed_world
+from pydenim.services import lineage
+
+
+def test_seed_world():
+    seeding = seed_world(Config(n_rows=6, n_cols=7, starting_organism_count=10, obstacle_chance=0.5))
+    assert len(seeding.positions) == len(set(seeding.positions)) == len(seeding.organisms) == 10
+    assert not set(seeding.obstacles) & set(seeding.positions)
+    for index in seeding.obstacles + seeding.positions:
+        y, x = divmod(index, 7)
+        assert 0 < y < 5 and 0 < x < 6
+
+
+@pytest.mark.parametrize('n_rows, n_cols, wrap', [(1, 5, False), (5, 2, False), (0, 5, True)])
+def test_config_too_small(n_rows, n_cols, wrap):
+    with pytest.raises(ValueError):
+        Config(n_rows=n_rows, n_cols=n_cols, starting_organism_count=0, wrap=wrap)
+
+
+def test_seed_world_too_many_organisms():
+    with pytest.raises(ValueError):
+        seed_world(Config(n_rows=4, n_cols=4, starting_organism_count=5))
+
+
+def test_found():
+    founders = found(20, 4)
+    assert all(len(organism.genome.genes) == 4 for organism in founders)
+    assert {organism.bio.gender for organism in founders} <= set(Gender)
+    assert all(lineage.parents(organism.id) == (None, None) for organism in founders)
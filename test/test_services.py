@@ -0,0 +1,60 @@
+import pickle
+
+import pytest
+
+from pydenim.services import IdGenerator, Rng
+
+
+def test_rng_reproducible():
+    assert Rng(1).randoms(5) == Rng(1).randoms(5)
+    assert Rng(1).randoms(5) != Rng(2).randoms(5)
+
+
+def test_rng_split_independent_of_draws():
+    rng = Rng(1)
+    first = rng.split(3, 'tile').randoms(5)
+    rng.randoms(100)
+    rng.split(4, 'tile').randoms(5)
+    assert rng.split(3, 'tile').randoms(5) == first
+    assert rng.split(3, 'tile').split(7).randoms(5) == Rng(1, (3, 'tile', 7)).randoms(5)
+
+
+def test_rng_substream():
+    rng = Rng(1)
+    expected = Rng(1).randoms(3)
+    with rng.substream(3, 'tile') as substream:
+        assert substream.randoms(5) == Rng(1).split(3, 'tile').randoms(5)
+
+    assert rng.randoms(3) == expected
+
+
+def test_rng_numpy():
+    pytest.importorskip('numpy')
+    assert (Rng(1).numpy().random(5) == Rng(1).numpy().random(5)).all()
+
+
+def test_id_generator():
+    ids = IdGenerator()
+    assert ids() == 11
+    assert ids.allocate(3) == range(12, 15)
+    assert ids() == 15
+
+
+def test_id_generator_reserve():
+    ids = IdGenerator()
+    block = ids.reserve(3)
+    assert ids() == 14
+    assert [block(), block()] == [11, 12]
+    assert block.allocate(1) == range(13, 14)
+    with pytest.raises(ValueError):
+        block()
+
+
+def test_id_generator_checkpoint():
+    ids = IdGenerator()
+    ids.allocate(5)
+    block = pickle.loads(pickle.dumps(ids.reserve(5)))
+    restored = IdGenerator()
+    restored.restore(ids.checkpoint())
+    assert restored() == ids() == 21
+    assert block.allocate(5) == range(16, 21)
@@ -0,0 +1,37 @@
+import pytest
+
+from pydenim.config import Config
+from pydenim.misc.internal_types import Neighbourhood
+from pydenim.services import rng
+from pydenim.topology import MOORE, VON_NEUMANN, Topology
+
+
+@pytest.mark.parametrize('wrap, expected', [
+    (False, ([1, 0, 5, 2], [0, 2, 3, -1])),
+    (True, ([1, 0, 0, 2], [0, 2, 3, 3])),
+])
+def test_neighbours(wrap, expected):
+    topology = Topology(4, 5, wrap=wrap)
+    assert topology.neighbours([0, 0, 4, 2], [1, 2, 3, 0], [(1, -1), (0, 0), (1, 0), (0, -1)]) == expected
+
+
+@pytest.mark.parametrize('neighbourhood, directions', [
+    (Neighbourhood.VonNeumann, VON_NEUMANN),
+    (Neighbourhood.Moore, MOORE),
+])
+def test_draw(neighbourhood, directions):
+    topology = Topology(4, 4, neighbourhood)
+    rng.reseed(2)
+    drawn = topology.draw(200)
+    assert len(drawn) == 200
+    assert set(drawn) == set(directions)
+    rng.reseed(2)
+    assert topology.draw(200) == drawn
+
+
+def test_of():
+    config = Config(n_rows=4, n_cols=6, starting_organism_count=0, wrap=True)
+    topology = Topology.of(config)
+    assert Topology.of(Config(n_rows=4, n_cols=6, starting_organism_count=2, wrap=True)) is topology
+    assert topology.margin == 0
+    assert Topology.of(Config(n_rows=4, n_cols=6, starting_organism_count=0)).margin == 1